@@ -5,7 +5,7 @@ from monsterui.all import *
 from fasthtml.svg import *
 import json
 
-app, rt = fast_app(hdrs=Theme.blue.headers())
+app, rt = fast_app(hdrs=(*Theme.blue.headers(), *ComponentScripts()))
 
 def LAlignedCheckTxt(txt): return DivLAligned(UkIcon(icon='check'), P(txt, cls=TextPresets.muted_sm))
 
@@ -37,9 +37,11 @@ avatar_opts = DropDownNavContainer(
     NavDividerLi(),
     *map(create_hotkey_li, hotkeys_b),)
 
-def CreateTaskModal():
-    return Modal(
-        Div(cls='p-6')(
+def CreateTaskModal(): return Modal(id='TaskForm', body_url=create_task_form.to())
+
+@rt('/tasks/create_task_form')
+def create_task_form():
+    return Div(cls='p-6')(
             ModalTitle('Create Task'),
             P('Fill out the information below to create a new task', cls=TextPresets.muted_sm),
             Br(),
@@ -51,8 +53,7 @@ def CreateTaskModal():
                 DivRAligned(
                     ModalCloseButton('Cancel', cls=ButtonT.ghost),
                     ModalCloseButton('Submit', cls=ButtonT.primary),
-                    cls='space-x-5'))),
-        id='TaskForm')
+                    cls='space-x-5')))
 
 page_heading = DivFullySpaced(cls='space-y-2')(
             Div(cls='space-y-2')(
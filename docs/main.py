@@ -25,7 +25,7 @@ def _not_found(req, exc):
 
 
 app,rt = fast_app(exception_handlers={404:_not_found}, pico=False, 
-                  hdrs=(*Theme.blue.headers(highlightjs=True,apex_charts=True), Link(rel="icon", type="image/x-icon", href="/favicon.ico"),
+                  hdrs=(*Theme.blue.headers(highlightjs=True,apex_charts=True), *ComponentScripts(), Link(rel="icon", type="image/x-icon", href="/favicon.ico"),
                         Link(rel="stylesheet", href="/custom_theme.css", type="text/css")), 
                   )
 
@@ -55,7 +55,7 @@ def with_layout(sidebar_section, content):
 # Build the Example Pages
 ###
  
-from examples.tasks import index as tasks_homepage
+from examples.tasks import index as tasks_homepage, create_task_form
 from examples.cards import index as cards_homepage
 from examples.dashboard import index as dashboard_homepage
 from examples.forms import index as forms_homepage
@@ -81,6 +81,11 @@ def scrollspy(o:str='', request=None): return _example_route('scrollspy', Div(Di
 @rt('/ticket/{o}')
 def ticket(o:str='', request=None): return _example_route('ticket', Div(DivRAligned(A("See Code",href='/ticket/code',cls='m-4 uk-btn'+ButtonT.default)),ticket_homepage()), o, request)
 
+@rt('/tasks/create_task_form')
+def tasks_create_task_form():
+    "Body of the tasks example's modal, fetched when it first opens (registered before the `/tasks/{o}` catch-all)"
+    return create_task_form()
+
 @rt('/tasks')
 @rt('/tasks/{o}')
 def tasks(o:str='', request=None): return _example_route('tasks', Div(DivRAligned(A("See Code",href='/tasks/code',cls='m-4 uk-btn'+ButtonT.default)),tasks_homepage()), o, request)
@@ -121,6 +126,12 @@ import api_reference.api_reference as api_reference
 def fname2title(ref_fn_name): return ref_fn_name[5:].replace('_',' | ').title() 
 
 reference_fns = L([o for o in dir(api_reference) if o.startswith('docs_')])
+@rt('/api_ref_nav')
+def api_ref_nav():
+    "Sidebar links to every API reference page, fetched when the section is first expanded"
+    return NavContainer(*[Li(A(fname2title(o), hx_target="#content", hx_get=f"/api_ref/{o}", hx_push_url='true')) for o in reference_fns],
+                        parent=False)
+
 @rt('/api_ref/{o}')
 def api_route(request, o:str):
     if o not in reference_fns: raise HTTPException(404)
@@ -221,10 +232,7 @@ def sidebar(open_section):
         ),
         NavParentLi(
             A(DivFullySpaced("API Reference", )),
-            NavContainer(
-                *[create_li(fname2title(o), f"/api_ref/{o}") for o in reference_fns],
-                parent=False,  
-            ),
+            children_url='/api_ref_nav',
             cls='uk-open' if open_section=='API Reference' else ''
         ),
         NavParentLi(
@@ -11,14 +11,22 @@ d = { 'settings': { 'branch': 'main',
                                 'monsterui.core.Theme._create_headers': ('core.html#theme._create_headers', 'monsterui/core.py'),
                                 'monsterui.core.Theme._generate_next_value_': ( 'core.html#theme._generate_next_value_',
                                                                                 'monsterui/core.py'),
+                                'monsterui.core.Theme.beforeware': ('core.html#theme.beforeware', 'monsterui/core.py'),
                                 'monsterui.core.Theme.headers': ('core.html#theme.headers', 'monsterui/core.py'),
                                 'monsterui.core.Theme.local_headers': ('core.html#theme.local_headers', 'monsterui/core.py'),
                                 'monsterui.core.ThemeFont': ('core.html#themefont', 'monsterui/core.py'),
                                 'monsterui.core.ThemeRadii': ('core.html#themeradii', 'monsterui/core.py'),
                                 'monsterui.core.ThemeShadows': ('core.html#themeshadows', 'monsterui/core.py'),
+                                'monsterui.core._attr': ('core.html#_attr', 'monsterui/core.py'),
+                                'monsterui.core._cached_attr': ('core.html#_cached_attr', 'monsterui/core.py'),
                                 'monsterui.core._download_resource': ('core.html#_download_resource', 'monsterui/core.py'),
+                                'monsterui.core._esc': ('core.html#_esc', 'monsterui/core.py'),
+                                'monsterui.core._ft_xml': ('core.html#_ft_xml', 'monsterui/core.py'),
                                 'monsterui.core._headers_theme': ('core.html#_headers_theme', 'monsterui/core.py'),
-                                'monsterui.core.fast_app': ('core.html#fast_app', 'monsterui/core.py')},
+                                'monsterui.core._join_vary': ('core.html#_join_vary', 'monsterui/core.py'),
+                                'monsterui.core.fast_app': ('core.html#fast_app', 'monsterui/core.py'),
+                                'monsterui.core.fast_xml': ('core.html#fast_xml', 'monsterui/core.py'),
+                                'monsterui.core.theme_classes': ('core.html#theme_classes', 'monsterui/core.py')},
             'monsterui.daisy': { 'monsterui.daisy.Alert': ('daisy.html#alert', 'monsterui/daisy.py'),
                                  'monsterui.daisy.AlertT': ('daisy.html#alertt', 'monsterui/daisy.py'),
                                  'monsterui.daisy.AlertT._generate_next_value_': ( 'daisy.html#alertt._generate_next_value_',
@@ -39,9 +47,20 @@ d = { 'settings': { 'branch': 'main',
                                  'monsterui.daisy.ToastHT': ('daisy.html#toastht', 'monsterui/daisy.py'),
                                  'monsterui.daisy.ToastHT._generate_next_value_': ( 'daisy.html#toastht._generate_next_value_',
                                                                                     'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub': ('daisy.html#toasthub', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub.__init__': ('daisy.html#toasthub.__init__', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub.publish': ('daisy.html#toasthub.publish', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub.sse': ('daisy.html#toasthub.sse', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub.subscribe': ('daisy.html#toasthub.subscribe', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastHub.ws': ('daisy.html#toasthub.ws', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastManager': ('daisy.html#toastmanager', 'monsterui/daisy.py'),
+                                 'monsterui.daisy.ToastMsg': ('daisy.html#toastmsg', 'monsterui/daisy.py'),
                                  'monsterui.daisy.ToastVT': ('daisy.html#toastvt', 'monsterui/daisy.py'),
                                  'monsterui.daisy.ToastVT._generate_next_value_': ( 'daisy.html#toastvt._generate_next_value_',
-                                                                                    'monsterui/daisy.py')},
+                                                                                    'monsterui/daisy.py'),
+                                 'monsterui.daisy.Toasts': ('daisy.html#toasts', 'monsterui/daisy.py'),
+                                 'monsterui.daisy._ToastConn': ('daisy.html#_toastconn', 'monsterui/daisy.py'),
+                                 'monsterui.daisy._ToastConn.__init__': ('daisy.html#_toastconn.__init__', 'monsterui/daisy.py')},
             'monsterui.foundations': { 'monsterui.foundations.VEnum': ('foundation.html#venum', 'monsterui/foundations.py'),
                                        'monsterui.foundations.VEnum.__add__': ('foundation.html#venum.__add__', 'monsterui/foundations.py'),
                                        'monsterui.foundations.VEnum.__radd__': ( 'foundation.html#venum.__radd__',
@@ -57,6 +76,7 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.AccordionItem': ('franken.html#accordionitem', 'monsterui/franken.py'),
                                    'monsterui.franken.Address': ('franken.html#address', 'monsterui/franken.py'),
                                    'monsterui.franken.ApexChart': ('franken.html#apexchart', 'monsterui/franken.py'),
+                                   'monsterui.franken.ApexChartData': ('franken.html#apexchartdata', 'monsterui/franken.py'),
                                    'monsterui.franken.Article': ('franken.html#article', 'monsterui/franken.py'),
                                    'monsterui.franken.ArticleMeta': ('franken.html#articlemeta', 'monsterui/franken.py'),
                                    'monsterui.franken.ArticleTitle': ('franken.html#articletitle', 'monsterui/franken.py'),
@@ -64,6 +84,7 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.BackgroundT._generate_next_value_': ( 'franken.html#backgroundt._generate_next_value_',
                                                                                             'monsterui/franken.py'),
                                    'monsterui.franken.Blockquote': ('franken.html#blockquote', 'monsterui/franken.py'),
+                                   'monsterui.franken.BulletChart': ('franken.html#bulletchart', 'monsterui/franken.py'),
                                    'monsterui.franken.Button': ('franken.html#button', 'monsterui/franken.py'),
                                    'monsterui.franken.ButtonT': ('franken.html#buttont', 'monsterui/franken.py'),
                                    'monsterui.franken.ButtonT._generate_next_value_': ( 'franken.html#buttont._generate_next_value_',
@@ -79,15 +100,28 @@ d = { 'settings': { 'branch': 'main',
                                                                                       'monsterui/franken.py'),
                                    'monsterui.franken.CardTitle': ('franken.html#cardtitle', 'monsterui/franken.py'),
                                    'monsterui.franken.Center': ('franken.html#center', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream': ('franken.html#chartstream', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.__init__': ('franken.html#chartstream.__init__', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream._sse': ('franken.html#chartstream._sse', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.append': ('franken.html#chartstream.append', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.options': ('franken.html#chartstream.options', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.publish': ('franken.html#chartstream.publish', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.sse': ('franken.html#chartstream.sse', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.subscribe': ( 'franken.html#chartstream.subscribe',
+                                                                                'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.update': ('franken.html#chartstream.update', 'monsterui/franken.py'),
+                                   'monsterui.franken.ChartStream.ws': ('franken.html#chartstream.ws', 'monsterui/franken.py'),
                                    'monsterui.franken.CheckboxX': ('franken.html#checkboxx', 'monsterui/franken.py'),
                                    'monsterui.franken.Cite': ('franken.html#cite', 'monsterui/franken.py'),
                                    'monsterui.franken.CodeBlock': ('franken.html#codeblock', 'monsterui/franken.py'),
                                    'monsterui.franken.CodeSpan': ('franken.html#codespan', 'monsterui/franken.py'),
+                                   'monsterui.franken.ComponentScripts': ('franken.html#componentscripts', 'monsterui/franken.py'),
                                    'monsterui.franken.Container': ('franken.html#container', 'monsterui/franken.py'),
                                    'monsterui.franken.ContainerT': ('franken.html#containert', 'monsterui/franken.py'),
                                    'monsterui.franken.ContainerT._generate_next_value_': ( 'franken.html#containert._generate_next_value_',
                                                                                            'monsterui/franken.py'),
                                    'monsterui.franken.Data': ('franken.html#data', 'monsterui/franken.py'),
+                                   'monsterui.franken.Deferred': ('franken.html#deferred', 'monsterui/franken.py'),
                                    'monsterui.franken.Del': ('franken.html#del', 'monsterui/franken.py'),
                                    'monsterui.franken.Details': ('franken.html#details', 'monsterui/franken.py'),
                                    'monsterui.franken.Dfn': ('franken.html#dfn', 'monsterui/franken.py'),
@@ -126,7 +160,22 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.H4': ('franken.html#h4', 'monsterui/franken.py'),
                                    'monsterui.franken.H5': ('franken.html#h5', 'monsterui/franken.py'),
                                    'monsterui.franken.H6': ('franken.html#h6', 'monsterui/franken.py'),
+                                   'monsterui.franken.HeatmapGrid': ('franken.html#heatmapgrid', 'monsterui/franken.py'),
                                    'monsterui.franken.I': ('franken.html#i', 'monsterui/franken.py'),
+                                   'monsterui.franken.IconSprite': ('franken.html#iconsprite', 'monsterui/franken.py'),
+                                   'monsterui.franken.IconSprite.__ft__': ('franken.html#iconsprite.__ft__', 'monsterui/franken.py'),
+                                   'monsterui.franken.IconSprite.__init__': ('franken.html#iconsprite.__init__', 'monsterui/franken.py'),
+                                   'monsterui.franken.IconSprite.beforeware': ( 'franken.html#iconsprite.beforeware',
+                                                                                'monsterui/franken.py'),
+                                   'monsterui.franken.ImagePipeline': ('franken.html#imagepipeline', 'monsterui/franken.py'),
+                                   'monsterui.franken.ImagePipeline.__init__': ( 'franken.html#imagepipeline.__init__',
+                                                                                 'monsterui/franken.py'),
+                                   'monsterui.franken.ImagePipeline._generate': ( 'franken.html#imagepipeline._generate',
+                                                                                  'monsterui/franken.py'),
+                                   'monsterui.franken.ImagePipeline.info': ('franken.html#imagepipeline.info', 'monsterui/franken.py'),
+                                   'monsterui.franken.ImagePipeline.path': ('franken.html#imagepipeline.path', 'monsterui/franken.py'),
+                                   'monsterui.franken.InfiniteList': ('franken.html#infinitelist', 'monsterui/franken.py'),
+                                   'monsterui.franken.InfinitePage': ('franken.html#infinitepage', 'monsterui/franken.py'),
                                    'monsterui.franken.Input': ('franken.html#input', 'monsterui/franken.py'),
                                    'monsterui.franken.Ins': ('franken.html#ins', 'monsterui/franken.py'),
                                    'monsterui.franken.Kbd': ('franken.html#kbd', 'monsterui/franken.py'),
@@ -148,6 +197,7 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.LoaderButton': ('franken.html#loaderbutton', 'monsterui/franken.py'),
                                    'monsterui.franken.Mark': ('franken.html#mark', 'monsterui/franken.py'),
                                    'monsterui.franken.Meter': ('franken.html#meter', 'monsterui/franken.py'),
+                                   'monsterui.franken.MiniBar': ('franken.html#minibar', 'monsterui/franken.py'),
                                    'monsterui.franken.Modal': ('franken.html#modal', 'monsterui/franken.py'),
                                    'monsterui.franken.ModalBody': ('franken.html#modalbody', 'monsterui/franken.py'),
                                    'monsterui.franken.ModalCloseButton': ('franken.html#modalclosebutton', 'monsterui/franken.py'),
@@ -174,6 +224,7 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.Q': ('franken.html#q', 'monsterui/franken.py'),
                                    'monsterui.franken.Radio': ('franken.html#radio', 'monsterui/franken.py'),
                                    'monsterui.franken.Range': ('franken.html#range', 'monsterui/franken.py'),
+                                   'monsterui.franken.ResponsiveImg': ('franken.html#responsiveimg', 'monsterui/franken.py'),
                                    'monsterui.franken.S': ('franken.html#s', 'monsterui/franken.py'),
                                    'monsterui.franken.Samp': ('franken.html#samp', 'monsterui/franken.py'),
                                    'monsterui.franken.ScrollSpy': ('franken.html#scrollspy', 'monsterui/franken.py'),
@@ -183,11 +234,15 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.SectionT._generate_next_value_': ( 'franken.html#sectiont._generate_next_value_',
                                                                                          'monsterui/franken.py'),
                                    'monsterui.franken.Select': ('franken.html#select', 'monsterui/franken.py'),
+                                   'monsterui.franken.Skeleton': ('franken.html#skeleton', 'monsterui/franken.py'),
                                    'monsterui.franken.Slider': ('franken.html#slider', 'monsterui/franken.py'),
                                    'monsterui.franken.SliderContainer': ('franken.html#slidercontainer', 'monsterui/franken.py'),
                                    'monsterui.franken.SliderItems': ('franken.html#slideritems', 'monsterui/franken.py'),
                                    'monsterui.franken.SliderNav': ('franken.html#slidernav', 'monsterui/franken.py'),
+                                   'monsterui.franken.SliderSlides': ('franken.html#sliderslides', 'monsterui/franken.py'),
                                    'monsterui.franken.Small': ('franken.html#small', 'monsterui/franken.py'),
+                                   'monsterui.franken.Sparkline': ('franken.html#sparkline', 'monsterui/franken.py'),
+                                   'monsterui.franken.StaticOptions': ('franken.html#staticoptions', 'monsterui/franken.py'),
                                    'monsterui.franken.Strong': ('franken.html#strong', 'monsterui/franken.py'),
                                    'monsterui.franken.Sub': ('franken.html#sub', 'monsterui/franken.py'),
                                    'monsterui.franken.Subtitle': ('franken.html#subtitle', 'monsterui/franken.py'),
@@ -196,8 +251,11 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.Switch': ('franken.html#switch', 'monsterui/franken.py'),
                                    'monsterui.franken.TabContainer': ('franken.html#tabcontainer', 'monsterui/franken.py'),
                                    'monsterui.franken.Table': ('franken.html#table', 'monsterui/franken.py'),
+                                   'monsterui.franken.TableFromColumns': ('franken.html#tablefromcolumns', 'monsterui/franken.py'),
                                    'monsterui.franken.TableFromDicts': ('franken.html#tablefromdicts', 'monsterui/franken.py'),
                                    'monsterui.franken.TableFromLists': ('franken.html#tablefromlists', 'monsterui/franken.py'),
+                                   'monsterui.franken.TableStream': ('franken.html#tablestream', 'monsterui/franken.py'),
+                                   'monsterui.franken.TableStreamResponse': ('franken.html#tablestreamresponse', 'monsterui/franken.py'),
                                    'monsterui.franken.TableT': ('franken.html#tablet', 'monsterui/franken.py'),
                                    'monsterui.franken.TableT._generate_next_value_': ( 'franken.html#tablet._generate_next_value_',
                                                                                        'monsterui/franken.py'),
@@ -220,6 +278,67 @@ d = { 'settings': { 'branch': 'main',
                                    'monsterui.franken.Upload': ('franken.html#upload', 'monsterui/franken.py'),
                                    'monsterui.franken.UploadZone': ('franken.html#uploadzone', 'monsterui/franken.py'),
                                    'monsterui.franken.Var': ('franken.html#var', 'monsterui/franken.py'),
+                                   'monsterui.franken.VirtualGrid': ('franken.html#virtualgrid', 'monsterui/franken.py'),
+                                   'monsterui.franken._RemoteSelect': ('franken.html#_remoteselect', 'monsterui/franken.py'),
                                    'monsterui.franken._TableCell': ('franken.html#_tablecell', 'monsterui/franken.py'),
+                                   'monsterui.franken._apex_json': ('franken.html#_apex_json', 'monsterui/franken.py'),
+                                   'monsterui.franken._apex_opts': ('franken.html#_apex_opts', 'monsterui/franken.py'),
+                                   'monsterui.franken._apex_points': ('franken.html#_apex_points', 'monsterui/franken.py'),
+                                   'monsterui.franken._apex_series': ('franken.html#_apex_series', 'monsterui/franken.py'),
+                                   'monsterui.franken._app_settings': ('franken.html#_app_settings', 'monsterui/franken.py'),
+                                   'monsterui.franken._assemble_upload': ('franken.html#_assemble_upload', 'monsterui/franken.py'),
+                                   'monsterui.franken._avatar_svg': ('franken.html#_avatar_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._avatar_url': ('franken.html#_avatar_url', 'monsterui/franken.py'),
+                                   'monsterui.franken._bullet_svg': ('franken.html#_bullet_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._cell_str': ('franken.html#_cell_str', 'monsterui/franken.py'),
+                                   'monsterui.franken._chart_color': ('franken.html#_chart_color', 'monsterui/franken.py'),
+                                   'monsterui.franken._chart_columns': ('franken.html#_chart_columns', 'monsterui/franken.py'),
+                                   'monsterui.franken._chart_labels': ('franken.html#_chart_labels', 'monsterui/franken.py'),
+                                   'monsterui.franken._chunk_attrs': ('franken.html#_chunk_attrs', 'monsterui/franken.py'),
+                                   'monsterui.franken._codes_agg': ('franken.html#_codes_agg', 'monsterui/franken.py'),
+                                   'monsterui.franken._col_values': ('franken.html#_col_values', 'monsterui/franken.py'),
+                                   'monsterui.franken._data_columns': ('franken.html#_data_columns', 'monsterui/franken.py'),
+                                   'monsterui.franken._downsample_idx': ('franken.html#_downsample_idx', 'monsterui/franken.py'),
+                                   'monsterui.franken._encode': ('franken.html#_encode', 'monsterui/franken.py'),
+                                   'monsterui.franken._grid_cls': ('franken.html#_grid_cls', 'monsterui/franken.py'),
+                                   'monsterui.franken._grouped': ('franken.html#_grouped', 'monsterui/franken.py'),
+                                   'monsterui.franken._heatmap_svg': ('franken.html#_heatmap_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._icon_symbol': ('franken.html#_icon_symbol', 'monsterui/franken.py'),
+                                   'monsterui.franken._img_path': ('franken.html#_img_path', 'monsterui/franken.py'),
+                                   'monsterui.franken._json_default': ('franken.html#_json_default', 'monsterui/franken.py'),
+                                   'monsterui.franken._lazy_imgs': ('franken.html#_lazy_imgs', 'monsterui/franken.py'),
+                                   'monsterui.franken._list_item_tag': ('franken.html#_list_item_tag', 'monsterui/franken.py'),
+                                   'monsterui.franken._lttb_idx': ('franken.html#_lttb_idx', 'monsterui/franken.py'),
+                                   'monsterui.franken._lucide_names': ('franken.html#_lucide_names', 'monsterui/franken.py'),
+                                   'monsterui.franken._mini_svg': ('franken.html#_mini_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._mini_vals': ('franken.html#_mini_vals', 'monsterui/franken.py'),
+                                   'monsterui.franken._minibar_svg': ('franken.html#_minibar_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._minmax_idx': ('franken.html#_minmax_idx', 'monsterui/franken.py'),
+                                   'monsterui.franken._nan_to_none': ('franken.html#_nan_to_none', 'monsterui/franken.py'),
+                                   'monsterui.franken._needs_script': ('franken.html#_needs_script', 'monsterui/franken.py'),
+                                   'monsterui.franken._num': ('franken.html#_num', 'monsterui/franken.py'),
+                                   'monsterui.franken._placeholder_svg': ('franken.html#_placeholder_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._placeholder_url': ('franken.html#_placeholder_url', 'monsterui/franken.py'),
+                                   'monsterui.franken._scale': ('franken.html#_scale', 'monsterui/franken.py'),
+                                   'monsterui.franken._seed_bytes': ('franken.html#_seed_bytes', 'monsterui/franken.py'),
+                                   'monsterui.franken._series_data': ('franken.html#_series_data', 'monsterui/franken.py'),
+                                   'monsterui.franken._series_xy': ('franken.html#_series_xy', 'monsterui/franken.py'),
+                                   'monsterui.franken._session_owner': ('franken.html#_session_owner', 'monsterui/franken.py'),
+                                   'monsterui.franken._setting': ('franken.html#_setting', 'monsterui/franken.py'),
+                                   'monsterui.franken._sparkline_svg': ('franken.html#_sparkline_svg', 'monsterui/franken.py'),
+                                   'monsterui.franken._svg_response': ('franken.html#_svg_response', 'monsterui/franken.py'),
+                                   'monsterui.franken._sweep_parts': ('franken.html#_sweep_parts', 'monsterui/franken.py'),
+                                   'monsterui.franken._use_icon': ('franken.html#_use_icon', 'monsterui/franken.py'),
                                    'monsterui.franken.apply_classes': ('franken.html#apply_classes', 'monsterui/franken.py'),
-                                   'monsterui.franken.render_md': ('franken.html#render_md', 'monsterui/franken.py')}}}
+                                   'monsterui.franken.bar_chart_opts': ('franken.html#bar_chart_opts', 'monsterui/franken.py'),
+                                   'monsterui.franken.chart_data_routes': ('franken.html#chart_data_routes', 'monsterui/franken.py'),
+                                   'monsterui.franken.chart_data_url': ('franken.html#chart_data_url', 'monsterui/franken.py'),
+                                   'monsterui.franken.decode_cursor': ('franken.html#decode_cursor', 'monsterui/franken.py'),
+                                   'monsterui.franken.encode_cursor': ('franken.html#encode_cursor', 'monsterui/franken.py'),
+                                   'monsterui.franken.heatmap_opts': ('franken.html#heatmap_opts', 'monsterui/franken.py'),
+                                   'monsterui.franken.histogram_opts': ('franken.html#histogram_opts', 'monsterui/franken.py'),
+                                   'monsterui.franken.placeholder_routes': ('franken.html#placeholder_routes', 'monsterui/franken.py'),
+                                   'monsterui.franken.register_options': ('franken.html#register_options', 'monsterui/franken.py'),
+                                   'monsterui.franken.render_md': ('franken.html#render_md', 'monsterui/franken.py'),
+                                   'monsterui.franken.server_icons': ('franken.html#server_icons', 'monsterui/franken.py'),
+                                   'monsterui.franken.upload_routes': ('franken.html#upload_routes', 'monsterui/franken.py')}}}
@@ -1,8 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_core.ipynb.
 
 # %% auto 0
-__all__ = ['HEADER_URLS', 'daisy_styles', 'scrollspy_style', 'fast_app', 'FastHTML', 'ThemeRadii', 'ThemeShadows', 'ThemeFont',
-           'Theme']
+__all__ = ['theme_cookie_js', 'HEADER_URLS', 'daisy_styles', 'scrollspy_style', 'fast_app', 'FastHTML', 'ThemeRadii',
+           'ThemeShadows', 'ThemeFont', 'theme_classes', 'Theme', 'fast_xml']
 
 # %% ../nbs/01_core.ipynb
 import fasthtml.common as fh
@@ -10,7 +10,8 @@ from .foundations import *
 from fasthtml.common import FastHTML, fast_app
 from enum import Enum, auto
 from fastcore.all import *
-import httpx
+import httpx, json, re
+from urllib.parse import unquote
 from pathlib import Path
 
 # %% ../nbs/01_core.ipynb
@@ -81,6 +82,63 @@ def _headers_theme(color, mode='auto', radii=ThemeRadii.sm, shadows=ThemeShadows
           htmlElement.classList.add(__FRANKEN__.font || "{font}");
     ''')
 
+# %% ../nbs/01_core.ipynb
+theme_cookie_js = '''
+(() => {
+if (window.__muiThemeCookie) return;
+window.__muiThemeCookie = true;
+const html = document.documentElement, kinds = ['theme', 'radii', 'shadows', 'font'];
+const read = () => {
+  const o = {mode: html.classList.contains('dark') ? 'dark' : 'light'};
+  for (const c of html.classList) for (const k of kinds) if (c.startsWith(`uk-${k}-`)) o[k] = c;
+  return JSON.stringify(o);
+};
+let last = null;
+const save = () => {
+  const v = read();
+  if (v === last) return;
+  last = v;
+  localStorage.setItem('__FRANKEN__', v);
+  document.cookie = `__FRANKEN__=${encodeURIComponent(v)}; path=/; max-age=31536000; samesite=lax`;
+};
+// Without a cookie (or client hint) the server can't know the OS color scheme yet
+if (html.dataset.themeMode === 'auto' && !/(^|; )__FRANKEN__=/.test(document.cookie))
+  html.classList.toggle('dark', matchMedia('(prefers-color-scheme: dark)').matches);
+save();
+new MutationObserver(save).observe(html, {attributes: true, attributeFilter: ['class']});
+})();
+'''
+_theme_prefixes = {'theme': 'uk-theme-', 'radii': 'uk-radii-', 'shadows': 'uk-shadows-', 'font': 'uk-font-'}
+
+def theme_classes(cookie:str=None, # Value of the `__FRANKEN__` cookie
+                  color='zinc', # Default theme color
+                  mode='auto', # `light` or `dark` override the cookie, `auto` uses it (or `prefers`)
+                  radii=ThemeRadii.sm, # Default radii
+                  shadows=ThemeShadows.sm, # Default shadows
+                  font=ThemeFont.sm, # Default font
+                  prefers:str=None, # `Sec-CH-Prefers-Color-Scheme` client hint, used when `mode='auto'` and there's no cookie
+                 )->str: # Classes for the `Html` tag
+    "`<html>` classes for the theme saved in the cookie written with `Theme.headers(cookie=True)`, falling back to the defaults"
+    try: saved = json.loads(unquote(cookie)) if cookie else {}
+    except ValueError: saved = {}
+    if not isinstance(saved, dict): saved = {}
+    dflt = dict(theme=f'uk-theme-{color}', radii=radii, shadows=shadows, font=font)
+    cls = [v if isinstance(v := saved.get(k), str) and re.fullmatch(re.escape(p) + r'[\w-]+', v) else stringify(dflt[k])
+           for k, p in _theme_prefixes.items()]
+    if mode == 'auto': mode = saved.get('mode') or prefers
+    return ' '.join(cls + (['dark'] if mode == 'dark' else []))
+
+# The `Vary` FastHTML sends with every response (its htmx request headers)
+_htmx_vary = f"{fh.htmx_hdrs['request']}, {fh.htmx_hdrs['history_restore_request']}"
+
+def _join_vary(*vals):
+    "`Vary` value listing each header of `vals` once"
+    hdrs = {}
+    for v in vals:
+        for h in str(v).split(','):
+            if h := h.strip(): hdrs.setdefault(h.lower(), h)
+    return ', '.join(hdrs.values())
+
 # %% ../nbs/01_core.ipynb
 HEADER_URLS = {
         'franken_css': "https://cdn.jsdelivr.net/npm/franken-ui@2.0.0/dist/css/core.min.css",
@@ -183,10 +241,12 @@ class Theme(Enum):
     violet = auto()
     zinc = auto()
 
-    def _create_headers(self, urls, mode='auto', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii=ThemeRadii.sm, shadows=ThemeShadows.sm, font=ThemeFont.sm):
+    def _create_headers(self, urls, mode='auto', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii=ThemeRadii.sm, shadows=ThemeShadows.sm, font=ThemeFont.sm, cookie=False):
         "Create header elements with given URLs"
         hdrs = [
             fh.Link(rel="stylesheet", href=urls['franken_css']),
+            # Deferred (module) and ahead of the franken core, so the theme switcher reads the synced `localStorage`
+            fh.Script(theme_cookie_js, type='module') if cookie else None,
             fh.Script(type="module", src=urls['franken_js_core']),
             fh.Script(src=urls['tailwind']),
             fh.Script("""
@@ -194,8 +254,9 @@ class Theme(Enum):
         darkMode: 'selector',
     }
     """),
-            _headers_theme(self.value, mode=mode, radii=radii, shadows=shadows, font=font),
+            None if cookie else _headers_theme(self.value, mode=mode, radii=radii, shadows=shadows, font=font),
             scrollspy_style]
+        hdrs = [h for h in hdrs if h is not None]
 
         if icons: hdrs.append(fh.Script(type="module", src=urls['franken_icons']))
         if daisy: hdrs += [fh.Link(rel="stylesheet", href=urls['daisyui']), daisy_styles]
@@ -253,12 +314,91 @@ class Theme(Enum):
                 ]
         return hdrs
 
-    def headers(self, mode='auto', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii=ThemeRadii.sm, shadows=ThemeShadows.sm, font=ThemeFont.sm ):
+    def headers(self, mode='auto', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii=ThemeRadii.sm, shadows=ThemeShadows.sm, font=ThemeFont.sm, cookie=False):
         "Create frankenui and tailwind cdns"
-        return self._create_headers(HEADER_URLS, mode=mode, icons=icons, daisy=daisy, highlightjs=highlightjs, katex=katex, apex_charts=apex_charts, radii=radii, shadows=shadows, font=font)    
+        return self._create_headers(HEADER_URLS, mode=mode, icons=icons, daisy=daisy, highlightjs=highlightjs, katex=katex, apex_charts=apex_charts, radii=radii, shadows=shadows, font=font, cookie=cookie)    
     
-    def local_headers(self, mode='auto', static_dir='static', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii='md', shadows='sm', font='sm'):
+    def local_headers(self, mode='auto', static_dir='static', icons=True, daisy=True, highlightjs=False, katex=False, apex_charts=False, radii='md', shadows='sm', font='sm', cookie=False):
         "Create headers using local files downloaded from CDNs"
         Path(static_dir).mkdir(exist_ok=True)
         local_urls = dict([_download_resource(url, static_dir) for url in HEADER_URLS.items()])
-        return self._create_headers(local_urls, mode=mode, icons=icons, daisy=daisy, highlightjs=highlightjs, katex=katex, apex_charts=apex_charts, radii=radii, shadows=shadows, font=font)
+        return self._create_headers(local_urls, mode=mode, icons=icons, daisy=daisy, highlightjs=highlightjs, katex=katex, apex_charts=apex_charts, radii=radii, shadows=shadows, font=font, cookie=cookie)
+
+    def beforeware(self, mode='auto', radii=ThemeRadii.sm, shadows=ThemeShadows.sm, font=ThemeFont.sm, skip=None):
+        "Beforeware putting the theme saved by `headers(cookie=True)` on `<html>`, so pages render themed without a blocking script (its `Vary: Cookie` rules out shared caching of those pages)"
+        def _before(req):
+            prefers = req.headers.get('sec-ch-prefers-color-scheme')
+            cls = theme_classes(req.cookies.get('__FRANKEN__'), self.value, mode, radii, shadows, font, prefers)
+            req.htmlkw['cls'] = stringify((req.htmlkw['cls'], cls)) if req.htmlkw.get('cls') else cls
+            # Cached pages differ by cookie (and by OS color scheme when `auto`), on top of FastHTML's own htmx `Vary`
+            # and any `Vary` injected by earlier beforeware (the last injected header wins)
+            prev = [o.v for o in req.injects if isinstance(o, fh.HttpHeader) and o.k.lower() == 'vary']
+            extra = ['Cookie'] + (['Sec-CH-Prefers-Color-Scheme'] if mode == 'auto' else [])
+            req.injects.append(fh.HttpHeader('vary', _join_vary(_htmx_vary, *prev, *extra)))
+            if mode == 'auto':
+                req.htmlkw['data_theme_mode'] = 'auto'
+                req.injects.append(fh.HttpHeader('accept-ch', 'Sec-CH-Prefers-Color-Scheme'))
+        return fh.Beforeware(_before, skip=skip)
+
+# %% ../nbs/01_core.ipynb
+import fastcore.xml as fx
+from functools import lru_cache
+from html import escape
+
+# %% ../nbs/01_core.ipynb
+_ws_tags = {'pre', 'code', 'textarea', 'script'}
+
+@lru_cache(maxsize=8192, typed=True)
+def _cached_attr(k, v): return fx._to_attr(k, v)
+
+def _attr(k, v):
+    "Rendered `k=v` attribute, cached for plain scalar and `Enum` values (whose rendering can't change)"
+    if v is True: return k
+    if type(v) in (str, int, float, bool) or isinstance(v, Enum): return _cached_attr(k, v)
+    return fx._to_attr(k, v)
+
+def _esc(s):
+    "Same as `to_xml` escaping with a fast path for plain strings"
+    if type(s) is str: return escape(s, quote=False)
+    return fx._escape(s)
+
+def _ft_xml(elm, out, lvl, indent, esc):
+    "Appends the xml for `elm` to the `out` buffer, mirroring `fastcore.xml._to_xml`"
+    if type(elm) is not FT:
+        if elm is None: return
+        if hasattr(elm, '__ft__'): elm = elm.__ft__()
+        if isinstance(elm, tuple):
+            for o in elm: _ft_xml(o, out, lvl, indent, esc)
+            return
+        if isinstance(elm, bytes): return out.append(elm.decode('utf-8'))
+        if not isinstance(elm, FT): return out.append(f'{esc(elm)}')
+    tag, cs, attrs = elm.tag, elm.children, elm.attrs
+    is_void = getattr(elm, 'void_', False)
+    if tag in _ws_tags or attrs.get('contenteditable') == 'true': indent = False
+    sp, nl = (' ' * lvl, '\n') if indent and tag in fx._block_tags else ('', '')
+    stag = tag
+    if attrs:
+        sattrs = ' '.join(_attr(k, v) for k, v in attrs.items() if v is not False and v is not None and (k=='_' or k[-1]!='_'))
+        if sattrs: stag += f' {sattrs}'
+    cltag = '' if is_void else f'</{tag}>'
+    stag_ = f'<{stag}>' if stag else ''
+    if not cs: return out.append(f'{sp}{stag_}{nl}' if is_void else f'{sp}{stag_}{cltag}{nl}')
+    if len(cs) == 1 and not isinstance(cs[0], (list, tuple, FT)) and not hasattr(cs[0], '__ft__'):
+        return out.append(f'{sp}{stag_}{esc(cs[0])}{cltag}{nl}')
+    out.append(f'{sp}{stag_}{nl}')
+    for c in cs: _ft_xml(c, out, lvl+2 if indent else 0, indent, esc)
+    if not is_void: out.append(f'{sp}{cltag}{nl}')
+
+# %% ../nbs/01_core.ipynb
+def fast_xml(elm, # FT component (or list/tuple of them) to serialize
+             lvl=0, # Starting indentation level
+             indent=True, # Whether to indent block tags
+             do_escape=True # Whether to escape text content
+            )->str: # Same string as `to_xml`
+    "Drop in replacement for `to_xml` that serializes into a single buffer and caches attribute strings"
+    if isinstance(elm, (list, tuple, FT)) or hasattr(elm, '__ft__'):
+        out = []
+        _ft_xml(elm, out, lvl, indent, _esc if do_escape else fx._noescape)
+        return fx.Safe(''.join(out))
+    if isinstance(elm, bytes): return elm.decode('utf-8')
+    return elm or ''
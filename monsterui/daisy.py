@@ -1,7 +1,8 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_daisy.ipynb.
 
 # %% auto 0
-__all__ = ['AlertT', 'Alert', 'StepsT', 'StepT', 'Steps', 'LiStep', 'LoadingT', 'Loading', 'ToastHT', 'ToastVT', 'Toast']
+__all__ = ['toast_js', 'AlertT', 'Alert', 'StepsT', 'StepT', 'Steps', 'LiStep', 'LoadingT', 'Loading', 'ToastHT', 'ToastVT',
+           'Toast', 'ToastManager', 'ToastMsg', 'Toasts', 'ToastHub']
 
 # %% ../nbs/03_daisy.ipynb
 import fasthtml.common as fh
@@ -10,7 +11,7 @@ from fasthtml.common import Div, Span, FT
 from fasthtml.svg import *
 from enum import auto
 from fastcore.all import *
-
+import asyncio
 
 # %% ../nbs/03_daisy.ipynb
 class AlertT(VEnum):
@@ -117,3 +118,130 @@ def Toast(*c, # Content for toast (often test)
     _id = fh.unqid()
     js = '''(() => setTimeout(() => document.querySelector('[data-mui="%s"]').remove(),%s))()'''%(_id,dur*1000)
     return Div(a, NotStr(f"<script>{js}</script>"), data_mui=_id, cls=('toast', stringify(cls)), **kwargs)
+
+# %% ../nbs/03_daisy.ipynb
+toast_js = '''
+(() => {
+if (window.__muiToasts) return;
+window.__muiToasts = true;
+const cfg = document.currentScript.dataset, max = +cfg.maxVisible || 3, cap = +cfg.queueMax || 20, gap = +cfg.interval || 250;
+const queue = [], shown = [];
+let last = 0, timer = null;
+const holder = pos => {
+  let h = document.querySelector(`[data-mui-toasts="${pos}"]`);
+  if (!h) {
+    h = document.createElement('div');
+    h.className = `toast ${pos} z-50`;
+    h.dataset.muiToasts = pos;
+    document.body.append(h);
+  }
+  return h;
+};
+const tick = () => {
+  const now = Date.now();
+  for (let i = shown.length - 1; i >= 0; i--) if (shown[i].until <= now || !shown[i].el.isConnected) shown.splice(i, 1)[0].el.remove();
+  while (queue.length && shown.length < max && now - last >= gap) {
+    const el = queue.shift();
+    last = now;
+    holder(el.dataset.pos || 'toast-end toast-bottom').append(el);
+    shown.push({el, until: now + (+el.dataset.dur || 5000)});
+  }
+  timer = queue.length || shown.length ? setTimeout(tick, Math.min(gap, 100)) : null;
+};
+const enqueue = el => {
+  el.remove();
+  queue.push(el);
+  while (queue.length > cap) queue.shift();
+  if (!timer) tick();
+};
+const init = () => {
+  const inbox = document.createElement('div');
+  inbox.id = 'mui-toasts';
+  inbox.hidden = true;
+  document.body.append(inbox);
+  new MutationObserver(ms => ms.forEach(m => m.addedNodes.forEach(n => n.nodeType === 1 && enqueue(n)))).observe(inbox, {childList: true});
+  document.addEventListener('click', e => { const t = e.target.closest('.mui-toast'); if (t && t.parentElement !== inbox) t.remove(); });
+  if (!cfg.feed) return;
+  const add = html => inbox.insertAdjacentHTML('beforeend', html);
+  if (cfg.feedProto === 'ws') {
+    const u = new URL(cfg.feed, location.href);
+    if (u.protocol.startsWith('http')) u.protocol = u.protocol === 'https:' ? 'wss:' : 'ws:';
+    new WebSocket(u).onmessage = e => add(e.data);
+  } else new EventSource(cfg.feed).addEventListener('toast', e => add(e.data));
+};
+document.body ? init() : document.addEventListener('DOMContentLoaded', init);
+})();
+'''
+
+# %% ../nbs/03_daisy.ipynb
+def ToastManager(max_visible:int=3, # Most toasts shown at once
+                 queue_max:int=20, # Most toasts waiting to be shown (the oldest are dropped)
+                 interval:float=0.25, # Minimum seconds between two toasts appearing
+                 feed_url:str=None, # `ToastHub` endpoint to receive broadcast toasts from
+                 feed_proto:str='sse', # Protocol of `feed_url` (`sse` or `ws`)
+                )->FT: # Script to add to the app headers
+    "Script that queues and shows every `ToastMsg`, added once to the headers"
+    return fh.Script(toast_js, data_max_visible=max_visible, data_queue_max=queue_max, data_interval=int(interval*1000),
+                     data_feed=feed_url, data_feed_proto=feed_proto if feed_url else None)
+
+def ToastMsg(*c, # Content for toast (often text)
+             cls='', # Position of the toast (`ToastHT` and `ToastVT` options)
+             alert_cls='', # Classes for alert (often `AlertT` options)
+             dur=5.0, # No. of seconds the toast is shown for
+             **kwargs # Additional args for the toast (`Div` tag)
+            )->FT: # Div(Alert(...), cls='mui-toast')
+    "A toast shown by the `ToastManager`, without any script of its own"
+    return Div(Alert(*c, cls=alert_cls), cls='mui-toast cursor-pointer', data_dur=int(dur*1000),
+               data_pos=stringify(cls) or None, **kwargs)
+
+def Toasts(*toasts, # `ToastMsg`s (or content, which is wrapped in a `ToastMsg`)
+          )->FT: # Div(..., hx_swap_oob='beforeend:#mui-toasts')
+    "Batches `toasts` into one out of band swap for an htmx response"
+    return Div(*[t if isinstance(t, FT) and 'mui-toast' in t.get('class', '') else ToastMsg(t) for t in toasts],
+               hx_swap_oob='beforeend:#mui-toasts')
+
+# %% ../nbs/03_daisy.ipynb
+class _ToastConn:
+    def __init__(self, maxsize): self.q,self.dropped = asyncio.Queue(maxsize),0
+
+class ToastHub:
+    "Broadcasts toasts, rendered once per message, to every subscribed connection"
+    def __init__(self, 
+                 maxsize:int=32, # Messages queued per connection
+                 drop:str='oldest', # When a connection's queue is full: `oldest`, `newest` or `disconnect`
+                ):
+        if drop not in ('oldest', 'newest', 'disconnect'): raise ValueError(f'Unknown drop policy {drop!r}')
+        self.conns,self.maxsize,self.drop,self.dropped = set(),maxsize,drop,0
+
+    def publish(self, *toasts)->int:
+        "Renders `toasts` (`ToastMsg`s, `Alert`s or content) once and queues them for every connection"
+        html = ''.join(to_xml(t if isinstance(t, FT) else ToastMsg(t), indent=False) for t in toasts)
+        msg = (html, ('event: toast\n' + ''.join(f'data: {l}\n' for l in html.splitlines()) + '\n').encode())
+        for c in list(self.conns):
+            if c.q.full():
+                c.dropped += 1; self.dropped += 1
+                if self.drop == 'newest': continue
+                if self.drop == 'disconnect':
+                    self.conns.discard(c)
+                    while not c.q.empty(): c.q.get_nowait()
+                    c.q.put_nowait(None)
+                    continue
+                c.q.get_nowait()
+            c.q.put_nowait(msg)
+        return len(self.conns)
+
+    async def subscribe(self, sse:bool=True):
+        "Yields SSE frames (bytes) or html (str) for each message until the connection closes or is dropped"
+        c = _ToastConn(self.maxsize)
+        self.conns.add(c)
+        try:
+            while (msg := await c.q.get()) is not None: yield msg[1] if sse else msg[0]
+        finally: self.conns.discard(c)
+
+    def sse(self):
+        "`text/event-stream` response for a `ToastManager` with `feed_proto='sse'`"
+        return fh.EventStream(self.subscribe())
+
+    async def ws(self, ws):
+        "Forwards messages to the websocket `ws` for a `ToastManager` with `feed_proto='ws'`"
+        async for html in self.subscribe(sse=False): await ws.send_text(html)
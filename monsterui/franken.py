@@ -1,23 +1,30 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_franken.ipynb.
 
 # %% auto 0
-__all__ = ['franken_class_map', 'spy_js', 'TextT', 'TextPresets', 'CodeSpan', 'CodeBlock', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6',
-           'Subtitle', 'Q', 'Em', 'Strong', 'I', 'Small', 'Mark', 'Del', 'Ins', 'Sub', 'Sup', 'Blockquote', 'Caption',
-           'Cite', 'Time', 'Address', 'Abbr', 'Dfn', 'Kbd', 'Samp', 'Var', 'Figure', 'Details', 'Summary', 'Data',
-           'Meter', 'S', 'U', 'Output', 'PicSumImg', 'AccordionItem', 'Accordion', 'ButtonT', 'Button', 'ContainerT',
-           'BackgroundT', 'Container', 'Titled', 'DividerT', 'Divider', 'DividerSplit', 'DividerLine', 'Article',
-           'ArticleTitle', 'ArticleMeta', 'SectionT', 'Section', 'Form', 'Fieldset', 'Legend', 'Input', 'Radio',
-           'CheckboxX', 'Range', 'TextArea', 'Switch', 'Upload', 'UploadZone', 'FormLabel', 'LabelT', 'Label',
-           'UkFormSection', 'GenericLabelInput', 'LabelInput', 'LabelTextArea', 'LabelSwitch', 'LabelRadio',
-           'LabelCheckboxX', 'Options', 'Select', 'LabelSelect', 'LabelRange', 'AT', 'ListT', 'ModalContainer',
-           'ModalDialog', 'ModalHeader', 'ModalBody', 'ModalFooter', 'ModalTitle', 'ModalCloseButton', 'Modal',
-           'Placeholder', 'Progress', 'UkIcon', 'UkIconLink', 'DiceBearAvatar', 'Center', 'FlexT', 'Grid',
-           'DivFullySpaced', 'DivCentered', 'DivLAligned', 'DivRAligned', 'DivVStacked', 'DivHStacked', 'NavT',
-           'NavContainer', 'NavParentLi', 'NavDividerLi', 'NavHeaderLi', 'NavSubtitle', 'NavCloseLi', 'ScrollspyT',
-           'NavBar', 'SliderContainer', 'SliderItems', 'SliderNav', 'Slider', 'DropDownNavContainer', 'TabContainer',
-           'CardT', 'CardTitle', 'CardHeader', 'CardBody', 'CardFooter', 'CardContainer', 'Card', 'TableT', 'Table',
-           'Td', 'Th', 'Tbody', 'TableFromLists', 'TableFromDicts', 'apply_classes', 'FrankenRenderer', 'render_md',
-           'ThemePicker', 'LightboxContainer', 'LightboxItem', 'ApexChart', 'ScrollSpy', 'LoaderButton', 'ToggleBtn']
+__all__ = ['upload_js', 'remote_select_js', 'infinite_list_js', 'lazy_modal_js', 'deferred_js', 'virtual_grid_js',
+           'slider_more_js', 'franken_class_map', 'apex_stream_js', 'apex_lazy_js', 'spy_js', 'TextT', 'TextPresets',
+           'CodeSpan', 'CodeBlock', 'H1', 'H2', 'H3', 'H4', 'H5', 'H6', 'Subtitle', 'Q', 'Em', 'Strong', 'I', 'Small',
+           'Mark', 'Del', 'Ins', 'Sub', 'Sup', 'Blockquote', 'Caption', 'Cite', 'Time', 'Address', 'Abbr', 'Dfn', 'Kbd',
+           'Samp', 'Var', 'Figure', 'Details', 'Summary', 'Data', 'Meter', 'S', 'U', 'Output', 'placeholder_routes',
+           'PicSumImg', 'AccordionItem', 'Accordion', 'ButtonT', 'Button', 'ContainerT', 'BackgroundT', 'Container',
+           'Titled', 'DividerT', 'Divider', 'DividerSplit', 'DividerLine', 'Article', 'ArticleTitle', 'ArticleMeta',
+           'SectionT', 'Section', 'Form', 'Fieldset', 'Legend', 'Input', 'Radio', 'CheckboxX', 'Range', 'TextArea',
+           'Switch', 'Upload', 'UploadZone', 'upload_routes', 'FormLabel', 'LabelT', 'Label', 'UkFormSection',
+           'GenericLabelInput', 'LabelInput', 'LabelTextArea', 'LabelSwitch', 'LabelRadio', 'LabelCheckboxX', 'Options',
+           'register_options', 'StaticOptions', 'Select', 'LabelSelect', 'LabelRange', 'AT', 'ListT', 'encode_cursor',
+           'decode_cursor', 'InfinitePage', 'InfiniteList', 'ModalContainer', 'ModalDialog', 'ModalHeader', 'ModalBody',
+           'ModalFooter', 'ModalTitle', 'ModalCloseButton', 'Modal', 'Placeholder', 'Skeleton', 'Deferred', 'Progress',
+           'server_icons', 'IconSprite', 'UkIcon', 'UkIconLink', 'DiceBearAvatar', 'Center', 'FlexT', 'Grid',
+           'VirtualGrid', 'DivFullySpaced', 'DivCentered', 'DivLAligned', 'DivRAligned', 'DivVStacked', 'DivHStacked',
+           'NavT', 'NavContainer', 'NavParentLi', 'NavDividerLi', 'NavHeaderLi', 'NavSubtitle', 'NavCloseLi',
+           'ScrollspyT', 'NavBar', 'SliderContainer', 'SliderItems', 'SliderNav', 'SliderSlides', 'Slider',
+           'DropDownNavContainer', 'TabContainer', 'CardT', 'CardTitle', 'CardHeader', 'CardBody', 'CardFooter',
+           'CardContainer', 'Card', 'TableT', 'Table', 'Td', 'Th', 'Tbody', 'TableFromLists', 'TableFromDicts',
+           'TableStream', 'TableStreamResponse', 'TableFromColumns', 'apply_classes', 'ImagePipeline', 'ResponsiveImg',
+           'FrankenRenderer', 'render_md', 'ThemePicker', 'LightboxContainer', 'LightboxItem', 'ApexChart',
+           'ChartStream', 'chart_data_url', 'chart_data_routes', 'ApexChartData', 'bar_chart_opts', 'histogram_opts',
+           'heatmap_opts', 'Sparkline', 'MiniBar', 'BulletChart', 'HeatmapGrid', 'ScrollSpy', 'LoaderButton',
+           'ToggleBtn', 'ComponentScripts']
 
 # %% ../nbs/02_franken.ipynb
 import fasthtml.common as fh
@@ -25,18 +32,20 @@ from .foundations import *
 from fasthtml.common import Div, P, Span, FT
 from enum import Enum, auto
 from fasthtml.components import Uk_select,Uk_input_tag,Uk_icon,Uk_input_range, Uk_chart
-from functools import partial
-from itertools import zip_longest
-from typing import Union, Tuple, Optional, Sequence
+from functools import partial, lru_cache
+from itertools import zip_longest, accumulate
+from typing import Union, Tuple, Optional, Sequence, Iterator
 from fastcore.all import *
-import copy, re, httpx, os
+import copy, re, httpx, os, hashlib, contextvars, zipfile, importlib.resources
 import pathlib
 from mistletoe.html_renderer import HTMLRenderer
 from mistletoe.span_token import Image
 import mistletoe
 from lxml import html, etree
 import fasthtml.components as fh_comp
-import json
+import json, asyncio, io, base64, shutil, tempfile, inspect, warnings, time
+from urllib.parse import unquote, quote, urlencode
+from html import escape
 
 # %% ../nbs/02_franken.ipynb
 class TextT(VEnum):
@@ -373,6 +382,91 @@ def Output(*c:FT|str, # Contents of Output tag
     return fh.Output(*c, cls=('font-mono bg-secondary px-2 py-1 rounded', 
                              stringify(cls)), **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+_app_cfg = contextvars.ContextVar('monsterui_app_cfg', default=None)
+
+def _app_settings(app)->dict:
+    "Settings the route helpers keep on `app`, made current during its requests by a beforeware added on first use"
+    if (cfg := getattr(app.state, 'monsterui', None)) is None:
+        cfg = app.state.monsterui = {}
+        async def _current(req): _app_cfg.set(cfg)
+        app.before.insert(0, fh.Beforeware(_current))
+    return cfg
+
+def _setting(key, default=None):
+    "Setting `key` of the app handling the current request, or `default` (set by the last configured app) outside of requests"
+    return (_app_cfg.get() or {}).get(key, default)
+
+# %% ../nbs/02_franken.ipynb
+_local_img_path = None
+
+def _seed_bytes(seed)->bytes:
+    "32 deterministic bytes derived from `seed`"
+    return hashlib.sha256(str(seed).encode()).digest()
+
+@lru_cache(maxsize=4096)
+def _avatar_svg(seed:str)->str:
+    "Deterministic, mirrored 5x5 identicon for `seed`"
+    b = _seed_bytes(seed)
+    hue = int.from_bytes(b[:2], 'big') % 360
+    cells = ''.join(f'<rect x="{x}" y="{y}" width="1" height="1"/>' + (f'<rect x="{4-x}" y="{y}" width="1" height="1"/>' if x < 2 else '')
+                    for y in range(5) for x in range(3) if b[2 + y*3 + x] & 1)
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="-0.5 -0.5 6 6" shape-rendering="crispEdges">'
+            f'<rect x="-0.5" y="-0.5" width="6" height="6" fill="hsl({hue} 55% 88%)"/><g fill="hsl({hue} 55% 42%)">{cells}</g></svg>')
+
+@lru_cache(maxsize=1024)
+def _placeholder_svg(w:int, h:int, seed, grayscale:bool=False, blur:int=None)->str:
+    "Deterministic landscape-style placeholder image of `w` x `h`"
+    b = _seed_bytes(f'{seed}-{w}x{h}')
+    hue, sat = int.from_bytes(b[:2], 'big') % 360, 0 if grayscale else 55
+    col = lambda dh, l: f'hsl({(hue + dh) % 360} {sat}% {l}%)'
+    sun = f'<circle cx="{w * (0.2 + b[2] / 400):.0f}" cy="{h * (0.2 + b[3] / 1000):.0f}" r="{min(w, h) * 0.12:.0f}" fill="{col(40, 92)}"/>'
+    hill = lambda i, l: (f'<polygon points="0,{h} 0,{h * (0.55 + b[i] / 1000):.0f} {w * (0.3 + b[i+1] / 800):.0f},{h * (0.35 + b[i+2] / 1000):.0f} '
+                         f'{w},{h * (0.6 + b[i+3] / 1000):.0f} {w},{h}" fill="{col(180 + i*10, l)}"/>')
+    flt = f'<filter id="b"><feGaussianBlur stdDeviation="{max(1, min(10, blur))}"/></filter>' if blur else ''
+    grp = '<g filter="url(#b)">' if blur else '<g>'
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{w}" height="{h}" viewBox="0 0 {w} {h}">{flt}'
+            f'<defs><linearGradient id="g" x1="0" y1="0" x2="0" y2="1"><stop offset="0" stop-color="{col(0, 70)}"/>'
+            f'<stop offset="1" stop-color="{col(30, 90)}"/></linearGradient></defs>{grp}'
+            f'<rect width="{w}" height="{h}" fill="url(#g)"/>{sun}{hill(4, 45)}{hill(8, 30)}</g></svg>')
+
+def _img_path()->str:
+    "Prefix of the `placeholder_routes` endpoints of the current app, or None to use the third party services"
+    return _setting('img_path', _local_img_path)
+
+def _avatar_url(seed:str)->str:
+    "URL of the identicon for `seed` on the `placeholder_routes` endpoint"
+    return f"{_img_path()}/avatar/{quote(str(seed)[:_max_seed], safe='')}.svg"
+
+def _placeholder_url(w:int, h:int, seed=None, grayscale:bool=False, blur:int=None)->str:
+    "URL of the placeholder image on the `placeholder_routes` endpoint, holding every parameter needed to regenerate it"
+    q = urlencode({k: v for k, v in dict(id=seed, grayscale=int(grayscale) or None, blur=blur).items() if v is not None})
+    return f"{_img_path()}/pic/{w}x{h}.svg" + (f'?{q}' if q else '')
+
+def _svg_response(req, svg:str):
+    "Immutably cached `svg` response (the URL determines the image), or 304 for a matching `If-None-Match`"
+    hdrs = {'ETag': f'"{hashlib.sha1(svg.encode()).hexdigest()[:16]}"', 'Cache-Control': 'public, max-age=31536000, immutable'}
+    if req.headers.get('if-none-match') == hdrs['ETag']: return fh.Response(status_code=304, headers=hdrs)
+    return fh.Response(svg, media_type='image/svg+xml', headers=hdrs)
+
+_max_seed, _max_side = 200, 4096
+
+def placeholder_routes(app, # FastHTML app to add the endpoints to
+                       path:str='/_monsterui/img', # URL prefix of the endpoints
+                      ):
+    "Serves `DiceBearAvatar` and `PicSumImg` images from `app`, generated locally instead of by third party services"
+    global _local_img_path
+    _local_img_path = _app_settings(app)['img_path'] = path.rstrip('/')
+    @app.route(f'{_local_img_path}/avatar/{{seed:path}}.svg', methods=['get'])
+    def _avatar_endpoint(req, seed:str):
+        if len(seed) > _max_seed: return fh.Response(status_code=404)
+        return _svg_response(req, _avatar_svg(seed))
+    @app.route(f'{_local_img_path}/pic/{{w}}x{{h}}.svg', methods=['get'])
+    def _placeholder_endpoint(req, w:int, h:int, id:int=None, grayscale:int=0, blur:int=None):
+        if not (0 < w <= _max_side and 0 < h <= _max_side): return fh.Response(status_code=404)
+        return _svg_response(req, _placeholder_svg(w, h, id, bool(grayscale), blur))
+    return _avatar_endpoint, _placeholder_endpoint
+
 # %% ../nbs/02_franken.ipynb
 def PicSumImg(h:int=200,           # Height in pixels
               w:int=200,           # Width in pixels
@@ -382,6 +476,7 @@ def PicSumImg(h:int=200,           # Height in pixels
               **kwargs             # Additional args for Img tag
               )->FT:              # Img tag with picsum image
     "Creates a placeholder image using https://picsum.photos/"
+    if _img_path(): return fh.Img(src=_placeholder_url(w, h, id, grayscale, blur), loading="lazy", **kwargs)
     url = f"https://picsum.photos"
     if id is not None: url = f"{url}/id/{id}"
     url = f"{url}/{w}/{h}"
@@ -390,6 +485,10 @@ def PicSumImg(h:int=200,           # Height in pixels
         url = f"{url}{'?' if not grayscale else '&'}blur={max(1,min(10,blur))}"
     return fh.Img(src=url, loading="lazy", **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+_lazy_once = "if (this.dataset.loaded !== undefined) event.preventDefault(); else this.dataset.loaded = ''"
+_prefetch_next = "const n = this.closest('li').nextElementSibling?.querySelector('[data-lazy-accordion]'); if (n) htmx.trigger(n, 'muiprefetch')"
+
 # %% ../nbs/02_franken.ipynb
 def AccordionItem(title: Union[str, FT], # Content for the accordion item title
                   *c: FT,                # Content to display when the item is open
@@ -399,7 +498,9 @@ def AccordionItem(title: Union[str, FT], # Content for the accordion item title
                   open: bool = False,          # Whether this item should be open by default
                   li_kwargs: Optional[Dict] = None, # Additional attributes for the outer `Li` tag
                   a_kwargs: Optional[Dict] = None,  # Additional attributes for the title `A` tag
-                  div_kwargs: Optional[Dict] = None # Additional attributes for the content `Div` tag
+                  div_kwargs: Optional[Dict] = None, # Additional attributes for the content `Div` tag
+                  content_url: Optional[str] = None, # Load the content from this URL when first opened (`c` is shown while it loads)
+                  prefetch_next: bool = False # Once loaded, also load the next item's `content_url`
                   ) -> FT: # Li(A(title, Span(Icon, Icon)), Div(content))
     "Creates a single item for use within an Accordion component, handling title, content, and open state."
     li_attrs, a_attrs, div_attrs = li_kwargs or {}, a_kwargs or {}, div_kwargs or {}
@@ -409,6 +510,11 @@ def AccordionItem(title: Union[str, FT], # Content for the accordion item title
     combined_title_cls = stringify(('uk-accordion-title', stringify(title_cls)))
     content_classes = stringify(('uk-accordion-content', stringify(content_cls)))
     if 'href' not in a_attrs: a_attrs['href'] = '#'
+    if content_url:
+        c = c or (Div(cls='h-16 animate-pulse rounded-md bg-muted'),)
+        div_attrs = {'hx_get': content_url, 'hx_trigger': ('load, ' if open else '') + 'shown from:closest li, muiprefetch',
+                     'data_lazy_accordion': True, 'hx_on__before_request': _lazy_once, **div_attrs}
+        if prefetch_next: div_attrs.setdefault('hx_on__after_swap', _prefetch_next)
     icon_container = Span(
         UkIcon("chevron-down", cls="block group-[.uk-open]:hidden h-5 w-5"),
         UkIcon("chevron-up", cls="hidden group-[.uk-open]:block h-5 w-5")
@@ -647,6 +753,90 @@ def Switch(*c, # contents of Switch tag (often nothing)
     "A Switch with default styling"
     return fh.Input(*c, cls=('uk-toggle-switch uk-toggle-switch-primary min-w-9',stringify(cls)), type='checkbox', **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+_scripts_seen = set() # Scripts added by `ComponentScripts`, or already warned about
+
+def _needs_script(name, component):
+    "Warns once if `component` is rendered while `ComponentScripts` hasn't added its `name` script to any headers"
+    if name in _scripts_seen: return
+    _scripts_seen.add(name)
+    warnings.warn(f'{component} does nothing without `ComponentScripts()` (with `{name}=True`) in the app headers', stacklevel=3)
+
+# %% ../nbs/02_franken.ipynb
+upload_js = '''
+(() => {
+if (window.__muiUpload) return;
+window.__muiUpload = true;
+const hash = s => {
+  let h1 = 0xdeadbeef, h2 = 0x41c6ce57;
+  for (let i = 0; i < s.length; i++) { const c = s.charCodeAt(i); h1 = Math.imul(h1 ^ c, 2654435761); h2 = Math.imul(h2 ^ c, 1597334677); }
+  h1 = Math.imul(h1 ^ (h1 >>> 16), 2246822507) ^ Math.imul(h2 ^ (h2 >>> 13), 3266489909);
+  h2 = Math.imul(h2 ^ (h2 >>> 16), 2246822507) ^ Math.imul(h1 ^ (h1 >>> 13), 3266489909);
+  return (h2 >>> 0).toString(16).padStart(8, '0') + (h1 >>> 0).toString(16).padStart(8, '0');
+};
+const sleep = ms => new Promise(r => setTimeout(r, ms));
+const emit = (el, name, detail) => el.dispatchEvent(new CustomEvent('mui:upload-' + name, {bubbles: true, detail}));
+async function send(url, file, id, i, n, size) {
+  for (let attempt = 0; ; attempt++) {
+    let r, err;
+    try {
+      r = await fetch(`${url}/${id}?index=${i}&count=${n}`, {method: 'POST', body: file.slice(i * size, (i + 1) * size),
+        headers: {'Content-Type': 'application/octet-stream', 'X-File-Name': encodeURIComponent(file.name), 'X-File-Size': file.size}});
+    } catch (e) { err = e; }
+    if (r && r.ok) return r;
+    if (attempt >= 4 || (r && r.status < 500 && r.status !== 408 && r.status !== 429)) throw err || new Error(`chunk ${i}: HTTP ${r.status}`);
+    await sleep(500 * 2 ** attempt);
+  }
+}
+async function upload(el, file) {
+  const d = el.dataset, url = d.chunkUrl, size = +d.chunkSize, n = Math.max(1, Math.ceil(file.size / size));
+  const id = hash(`${file.name}:${file.size}:${file.lastModified}:${size}`), bar = d.progress && document.getElementById(d.progress);
+  let done = [];
+  try { const r = await fetch(`${url}/${id}`); if (r.ok) done = await r.json(); } catch (e) {}
+  const todo = [...Array(n).keys()].filter(i => !done.includes(i)), len = i => Math.min(size, file.size - i * size);
+  let sent = done.reduce((a, i) => a + len(i), 0), final;
+  const report = () => { if (bar) { bar.max = file.size; bar.value = sent; } emit(el, 'progress', {id, name: file.name, loaded: sent, total: file.size}); };
+  report();
+  const worker = async () => {
+    for (let i; (i = todo.shift()) !== undefined;) {
+      const r = await send(url, file, id, i, n, size);
+      if (r.status === 200) final = r;
+      sent += len(i); report();
+    }
+  };
+  await Promise.all(Array.from({length: Math.max(1, Math.min(+d.concurrency, todo.length))}, worker));
+  const html = final ? await final.text() : '', stored = final && decodeURIComponent(final.headers.get('X-Upload-Name') || ''), target = d.chunkTarget && document.querySelector(d.chunkTarget);
+  if (target) htmx.swap ? htmx.swap(target, html, {swapStyle: 'beforeend'}) : (target.insertAdjacentHTML('beforeend', html), htmx.process(target));
+  if (d.chunkName && stored) el.append(Object.assign(document.createElement('input'), {type: 'hidden', name: d.chunkName, value: stored}));
+  emit(el, 'done', {id, name: file.name, stored, response: html});
+}
+async function run(el, files) {
+  el._muiFailed = [];
+  for (const f of files) {
+    try { await upload(el, f); }
+    catch (error) { el._muiFailed.push(f); emit(el, 'error', {name: f.name, error}); }
+  }
+}
+document.addEventListener('change', e => {
+  const el = e.target.type === 'file' && e.target.closest('[data-chunk-url]');
+  if (!el) return;
+  run(el, [...e.target.files]);
+  e.target.value = '';
+});
+// Chunks already on the server are skipped, so retrying resumes a failed upload
+document.addEventListener('mui:upload-retry', e => { if (e.target._muiFailed?.length) run(e.target, e.target._muiFailed); });
+window.addEventListener('online', () => document.querySelectorAll('[data-chunk-url]').forEach(el => el._muiFailed?.length && run(el, el._muiFailed)));
+})();
+'''
+_upload_path = '/_monsterui/upload'
+
+def _chunk_attrs(chunked, chunk_size, concurrency, progress, target, name):
+    "Data attributes switching an upload component to chunked mode (handled by `upload_js` from `ComponentScripts`)"
+    if not chunked: return {}
+    _needs_script('upload', 'Chunked uploads')
+    return dict(data_chunk_url=chunked if isinstance(chunked, str) else _setting('upload_path', _upload_path), data_chunk_size=chunk_size, data_concurrency=concurrency,
+                data_progress=progress, data_chunk_target=target, data_chunk_name=name)
+
 # %% ../nbs/02_franken.ipynb
 def Upload(*c, # Contents of Upload tag button (often text)
           cls=(), # Classes in addition to Upload styling
@@ -654,40 +844,151 @@ def Upload(*c, # Contents of Upload tag button (often text)
           accept=None, # File types to accept (e.g. 'image/*')
           button_cls=ButtonT.default, # Classes for the button
           id=None, # ID for the file input
-          name=None, # Name for the file input
+          name=None, # Name for the file input (in chunked mode: hidden inputs holding the stored file names, relative to `dest`)
+          chunked:Union[bool,str]=False, # Upload in chunks to `upload_routes` (or to this URL), needs `ComponentScripts()`
+          chunk_size:int=5*2**20, # Bytes per chunk
+          concurrency:int=3, # Chunks uploaded in parallel
+          progress:str=None, # id of a `Progress` bar to report upload progress into
+          target:str=None, # CSS selector the final response of each upload is appended to
           **kwargs # Additional args for the outer div
           )->FT: # Div(Input(type='file'), Button(...))
     "A file upload component with default styling"
     input_kwargs = {'type': 'file', 'multiple': multiple}
     if accept: input_kwargs['accept'] = accept
     if id: input_kwargs['id'] = id
-    if name: input_kwargs['name'] = name
+    if name and not chunked: input_kwargs['name'] = name
+    chunk_kwargs = _chunk_attrs(chunked, chunk_size, concurrency, progress, target, name)
     return Div(
         fh.Input(**input_kwargs),
         Button(*c, cls=button_cls, submit=False, tabindex="-1"),
         cls=('w-full js-upload', stringify(cls)),
-        uk_form_custom=True)
+        uk_form_custom=True, **chunk_kwargs)
 
 def UploadZone(*c, # Contents of UploadZone tag (often text or other tags)
                cls=(), # Classes in addition to UploadZone styling
                multiple=False, # Whether to allow multiple file selection
                accept=None, # File types to accept (e.g. 'image/*')
                id=None, # ID for the file input
-               name=None, # Name for the file input
+               name=None, # Name for the file input (in chunked mode: hidden inputs holding the stored file names, relative to `dest`)
+               chunked:Union[bool,str]=False, # Upload in chunks to `upload_routes` (or to this URL), needs `ComponentScripts()`
+               chunk_size:int=5*2**20, # Bytes per chunk
+               concurrency:int=3, # Chunks uploaded in parallel
+               progress:str=None, # id of a `Progress` bar to report upload progress into
+               target:str=None, # CSS selector the final response of each upload is appended to
                **kwargs # Additional args for the outer div
                )->FT:
     "A file drop zone component with default styling"
     input_kwargs = {'type': 'file', 'multiple': multiple}
     if accept: input_kwargs['accept'] = accept 
     if id: input_kwargs['id'] = id
-    if name: input_kwargs['name'] = name
+    if name and not chunked: input_kwargs['name'] = name
+    chunk_kwargs = _chunk_attrs(chunked, chunk_size, concurrency, progress, target, name)
     return Div(
         Div(fh.Input(**input_kwargs),
             Span(*c),
             uk_form_custom=True, 
             cls='w-full'),
         cls=('js-upload uk-placeholder uk-text-center', stringify(cls)),
-        **kwargs)
+        **chunk_kwargs, **kwargs)
+
+# %% ../nbs/02_franken.ipynb
+def _assemble_upload(parts, count, dest, name):
+    "Concatenates the `count` chunk files in `parts` into a new file in `dest` and removes them"
+    dest.mkdir(parents=True, exist_ok=True)
+    stem, suffix = pathlib.Path(name).stem, pathlib.Path(name).suffix
+    for i in range(10_000):
+        try: f = open(out := dest / (name if i == 0 else f'{stem}-{i}{suffix}'), 'xb')
+        except FileExistsError: continue
+        break
+    with f:
+        for i in range(count):
+            with open(parts / f'{i}.part', 'rb') as p: shutil.copyfileobj(p, f, 2**20)
+    shutil.rmtree(parts)
+    return out
+
+def _sweep_parts(tmp, max_age):
+    "Removes chunk directories (and partial chunks) in `tmp` that haven't changed for `max_age` seconds"
+    cutoff = time.time() - max_age
+    for p in tmp.glob('*/*'):
+        try:
+            if p.stat().st_mtime > cutoff: continue
+            if p.is_dir(): shutil.rmtree(p, ignore_errors=True)
+            else: p.unlink()
+        except FileNotFoundError: pass
+
+def _session_owner(req)->str:
+    "Id kept in the session that keeps each visitor's upload chunks apart"
+    sess = req.scope.get('session')
+    return '_' if sess is None else sess.setdefault('mui_upload', fh.unqid().lstrip('_'))
+
+def upload_routes(app, # FastHTML app to add the endpoints to
+                  path:str='/_monsterui/upload', # URL prefix of the endpoints
+                  dest:str='uploads', # Directory completed files are written to
+                  tmp_dir:str=None, # Directory chunks are kept in until complete (defaults to `{dest}/.parts`)
+                  max_chunk:int=16*2**20, # Largest accepted chunk in bytes
+                  max_size:int=None, # Largest accepted file in bytes, counting the bytes actually received
+                  max_chunks:int=1024, # Most chunks per file (without `max_size` a file is at most `max_chunks*max_chunk` bytes)
+                  owner=_session_owner, # Called with the request, returns the id separating uploads of different users
+                  max_age:int=24*3600, # Seconds after which the chunks of an abandoned upload are removed
+                  on_complete=None, # Called (or awaited) with the `Path` of each completed file; its result is the response
+                 ):
+    "Adds the endpoints receiving `chunked` `Upload`/`UploadZone` files to `app`, streaming chunks to disk"
+    global _upload_path
+    path, dest = path.rstrip('/'), pathlib.Path(dest)
+    _upload_path = _app_settings(app)['upload_path'] = path
+    tmp, locks = pathlib.Path(tmp_dir) if tmp_dir else dest / '.parts', {}
+    valid = lambda uid: re.fullmatch(r'[\w-]{1,64}', uid)
+
+    @app.route(f'{path}/{{uid}}', methods=['get'])
+    def _upload_status(req, uid:str):
+        if not valid(uid) or not valid(who := owner(req)): return fh.Response(status_code=400)
+        _sweep_parts(tmp, max_age)
+        parts = tmp / who / uid
+        return fh.JSONResponse(sorted(int(p.stem) for p in parts.glob('*.part')) if parts.is_dir() else [])
+
+    @app.route(f'{path}/{{uid}}', methods=['post'])
+    async def _upload_chunk(req, uid:str, index:int, count:int):
+        name = pathlib.Path(unquote(req.headers.get('x-file-name', ''))).name
+        if not valid(uid) or not valid(who := owner(req)) or not name or not 0 <= index < count: return fh.Response(status_code=400)
+        try: size = int(req.headers.get('x-file-size', 0))
+        except ValueError: return fh.Response(status_code=400)
+        if count > max_chunks or (max_size and size > max_size): return fh.Response(status_code=413)
+        parts = tmp / who / uid
+        parts.parent.mkdir(parents=True, exist_ok=True)
+        # bytes already received for the other chunks of this file count towards `max_size`
+        limit = min(max_chunk, max_size - sum(p.stat().st_size for p in parts.glob('*.part') if p.stem != str(index))) if max_size else max_chunk
+        # chunks are streamed next to `parts`, so assembling (and removing) `parts` can't pull a chunk from under a write
+        fd, part = tempfile.mkstemp(dir=parts.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                n = 0
+                async for piece in req.stream():
+                    if (n := n + len(piece)) > limit: break
+                    f.write(piece)
+        except BaseException:
+            os.unlink(part)
+            raise
+        if n > limit:
+            os.unlink(part)
+            return fh.Response(status_code=413)
+        # moving chunks in and assembling them are serialized per upload, so exactly one request assembles the file
+        async with locks.setdefault(parts, asyncio.Lock()):
+            parts.mkdir(exist_ok=True)
+            os.replace(part, parts / f'{index}.part')
+            if len(list(parts.glob('*.part'))) < count: return fh.Response(status_code=202)
+            try: out = await asyncio.to_thread(_assemble_upload, parts, count, dest, name)
+            finally: locks.pop(parts, None)
+        if size and out.stat().st_size != size:
+            out.unlink()
+            return fh.Response(status_code=400)
+        res = on_complete(out) if on_complete else out.name
+        if inspect.isawaitable(res): res = await res
+        # the stored name (made unique within `dest`) is what the component's hidden input submits
+        if isinstance(res, fh.Response):
+            res.headers['x-upload-name'] = quote(out.name)
+            return res
+        return res, fh.HttpHeader('X-Upload-Name', quote(out.name))
+    return _upload_chunk
 
 # %% ../nbs/02_franken.ipynb
 def FormLabel(*c, # contents of FormLabel tag (often text)
@@ -817,6 +1118,116 @@ def Options(*c,                    # Content for an `Option`
     "Helper function to wrap things into `Option`s for use in `Select`"
     return [fh.Option(o,selected=i==selected_idx, disabled=disabled_idxs and i in disabled_idxs) for i,o in enumerate(c)]
 
+# %% ../nbs/02_franken.ipynb
+_option_sets = {}
+
+def register_options(name:str, # Name used to reference the set with `StaticOptions`
+                     *c, # Content for each `Option`
+                     values:Sequence=None # Optional `value` for each `Option`
+                    ):
+    "Pre-renders a named set of `Option`s once so `Select`s can reference it cheaply with `StaticOptions`"
+    if values is not None and len(values) != len(c): raise ValueError(f'{len(values)} values for {len(c)} options')
+    opts = [fh.Option(o) if values is None else fh.Option(o, value=v) for o,v in zip(c, values or c)]
+    parts = [to_xml(o, indent=False) for o in opts]
+    ends = list(accumulate(map(len, parts)))
+    _option_sets[name] = dict(html=''.join(parts), opts=opts, starts=[0]+ends[:-1], ends=ends,
+                              idx={str(o.get('value', o.children[0])): i for i,o in enumerate(opts)})
+
+def StaticOptions(name:str, # Name the set was registered with in `register_options`
+                  selected_idx:int=None, # Index location of selected `Option`
+                  disabled_idxs:set=None, # Index locations of disabled `Options`
+                  selected_value=None # Value (or content) of selected `Option`, alternative to `selected_idx`
+                 )->NotStr: # Pre-rendered `Option`s for use in `Select`
+    "Pre-rendered `Option`s from `register_options` with only the selected and disabled entries re-rendered"
+    s = _option_sets[name]
+    if selected_value is not None: selected_idx = s['idx'].get(str(selected_value))
+    marked = sorted(set(disabled_idxs or ()) | ({selected_idx} if selected_idx is not None else set()))
+    if not marked: return NotStr(s['html'])
+    res, pos = [], 0
+    for i in marked:
+        o = s['opts'][i]
+        res += [s['html'][pos:s['starts'][i]],
+                to_xml(fh.Option(*o.children, **o.attrs, selected=i==selected_idx, disabled=i in (disabled_idxs or ())), indent=False)]
+        pos = s['ends'][i]
+    return NotStr(''.join(res) + s['html'][pos:])
+
+# %% ../nbs/02_franken.ipynb
+remote_select_js = '''
+(() => {
+if (window.__muiRemoteSelect) return;
+window.__muiRemoteSelect = true;
+const caches = new WeakMap();
+const parts = el => [el.querySelector('input[type=hidden]'), el.querySelector('input[type=search]'), el.querySelector('ul')];
+function render(el, html) {
+  const t = document.createElement('template'); t.innerHTML = html;
+  const items = [...t.content.querySelectorAll('option')].map(o => {
+    const li = document.createElement('li'), a = document.createElement('a');
+    a.href = '#'; a.dataset.value = o.value; a.textContent = o.textContent;
+    li.append(a); return li; });
+  const ul = parts(el)[2]; ul.replaceChildren(...items); ul.hidden = !items.length;
+}
+async function search(el, q) {
+  if (!caches.has(el)) caches.set(el, new Map());
+  const cache = caches.get(el);
+  el._muiCtrl?.abort();
+  if (cache.has(q)) { const html = cache.get(q); cache.delete(q); cache.set(q, html); return render(el, html); }
+  el._muiCtrl = new AbortController();
+  const url = new URL(el.dataset.remoteSelect, location.href); url.searchParams.set('q', q);
+  try {
+    const html = await (await fetch(url, {signal: el._muiCtrl.signal, headers: {'HX-Request': 'true'}})).text();
+    cache.set(q, html);
+    if (cache.size > (+el.dataset.cacheSize || 100)) cache.delete(cache.keys().next().value);
+    if (parts(el)[1].value === q) render(el, html);
+  } catch (e) { if (e.name !== 'AbortError') throw e; }
+}
+document.addEventListener('input', e => {
+  const el = e.target.closest('[data-remote-select]');
+  if (!el || e.target.type !== 'search') return;
+  clearTimeout(el._muiTimer);
+  el._muiTimer = setTimeout(() => search(el, e.target.value), +el.dataset.delay || 300);
+});
+document.addEventListener('focusin', e => {
+  const el = e.target.closest('[data-remote-select]');
+  if (el && e.target.type === 'search') { const ul = parts(el)[2]; ul.hidden = !ul.children.length; }
+});
+document.addEventListener('click', e => {
+  document.querySelectorAll('[data-remote-select] > ul').forEach(ul => { if (!ul.parentNode.contains(e.target)) ul.hidden = true; });
+  const a = e.target.closest('[data-remote-select] a[data-value]');
+  if (!a) return;
+  e.preventDefault();
+  const el = a.closest('[data-remote-select]'), [inp, box, ul] = parts(el);
+  inp.value = a.dataset.value; box.value = a.textContent; ul.hidden = true;
+  el.dispatchEvent(new CustomEvent('uk-select:input', {bubbles: true, detail: {value: a.dataset.value}}));
+});
+})();
+'''
+
+# %% ../nbs/02_franken.ipynb
+def _RemoteSelect(*option, # `Option`s to render initially (often the selected option plus a first page)
+                  search_url, # Endpoint queried with `?q=...` that returns `Option`s
+                  id, # ID of the container (selection dispatches `uk-select:input` from it)
+                  name="", # Name of the hidden input that holds the selected value
+                  placeholder="", # Placeholder for the search input
+                  inp_cls=(), # Additional classes for the search input
+                  delay=300, # Debounce in ms before querying `search_url`
+                  cache_size=100, # Number of query results kept in the client side LRU cache
+                  **kwargs # Additional args for the container (hx attrs from `Select`)
+                 )->FT: # Div(Input(hidden), Input(search), Ul(...))
+    "Search box that queries `search_url` as the user types and renders the returned options as a dropdown list"
+    _needs_script('select', 'Select(search_url=...)')
+    def _val(o): return o.get('value', ''.join(map(str, o.children)))
+    # Pre-rendered options (e.g. `StaticOptions`) are parsed back into `Option`s
+    option = [o for opt in option for o in ([opt] if isinstance(opt, FT) else
+              [fh.Option(e.text_content(), **e.attrib) for e in html.fragments_fromstring(str(opt)) if getattr(e, 'tag', None) == 'option'] if opt else [])]
+    sel = first(o for o in option if o.get('selected'))
+    items = [Li(fh.A(*o.children, href='#', data_value=_val(o))) for o in option if not o.get('disabled')]
+    return Div(
+        fh.Input(type='hidden', name=name, value=_val(sel) if sel else ''),
+        Input(type='search', value=''.join(map(str, sel.children)) if sel else '', placeholder=placeholder,
+              autocomplete='off', cls=inp_cls),
+        fh.Ul(*items, hidden=True, cls='uk-nav uk-dropdown-nav absolute z-10 mt-1 w-full max-h-72 overflow-y-auto rounded-md border border-border bg-background p-1 shadow-md'),
+        id=id, cls='relative', data_remote_select=search_url, data_delay=delay, data_cache_size=cache_size, **kwargs)
+
 # %% ../nbs/02_franken.ipynb
 def Select(*option,            # Options for the select dropdown (can use `Options` helper function to create)
           inp_cls=(),         # Additional classes for the select input
@@ -828,7 +1239,9 @@ def Select(*option,            # Options for the select dropdown (can use `Optio
           searchable=False,   # Whether the select should be searchable
           insertable=False,   # Whether to allow user-defined options to be added
           select_kwargs=None, # Additional Arguments passed to Select
-          
+          search_url=None,    # Endpoint queried with `?q=...` for options as the user types (remote search mode, needs `ComponentScripts()`)
+          search_delay=300,   # Debounce in ms for remote search
+          search_cache=100,   # Number of remote search results cached client side
            **kwargs           # Additional arguments passed to Uk_select
           ):          
     "Creates a select dropdown with uk styling and option for adding a search box"
@@ -836,6 +1249,7 @@ def Select(*option,            # Options for the select dropdown (can use `Optio
     select_kwargs = ifnone(select_kwargs, {})
 
     if 'hx_trigger' not in kwargs: kwargs['hx_trigger']=''
+    if search_url and not id: id = fh.unqid()
     if 'change' in kwargs['hx_trigger']:
         if not id: id = fh.unqid()
         kwargs['hx_trigger'] = kwargs['hx_trigger'].replace('changed', f'uk-select:input from:#{id}')
@@ -849,6 +1263,9 @@ def Select(*option,            # Options for the select dropdown (can use `Optio
     kwargs['hx_include'] = kwargs['hx_include'].strip()
         
     if id and not name: name = id
+    if search_url:
+        return Div(cls=cls)(_RemoteSelect(*option, search_url=search_url, id=id, name=name, placeholder=placeholder,
+                                          inp_cls=inp_cls, delay=search_delay, cache_size=search_cache, **kwargs))
 
     uk_select = Uk_select(fh.Select(*option, hidden=True, 
                                     **select_kwargs, 
@@ -929,6 +1346,86 @@ class ListT(VEnum):
     divider = 'uk-list uk-list-divider'
     striped = 'uk-list uk-list-striped'
 
+# %% ../nbs/02_franken.ipynb
+def encode_cursor(**values)->str:
+    "Opaque URL-safe pagination cursor holding `values` (e.g. the sort key of the last item on a page)"
+    return base64.urlsafe_b64encode(json.dumps(values, separators=(',', ':'), default=str).encode()).decode().rstrip('=')
+
+def decode_cursor(cursor:str)->dict:
+    "Values of a cursor made by `encode_cursor` (empty for a missing or malformed cursor)"
+    try: values = json.loads(base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))) if cursor else {}
+    except ValueError: return {}
+    return values if isinstance(values, dict) else {}
+
+# %% ../nbs/02_franken.ipynb
+infinite_list_js = '''
+(() => {
+if (window.__muiInfinite) return;
+window.__muiInfinite = true;
+const scroller = el => {
+  for (let p = el.parentElement; p && p !== document.body; p = p.parentElement) {
+    const o = getComputedStyle(p).overflowY;
+    if ((o === 'auto' || o === 'scroll') && p.scrollHeight > p.clientHeight) return p;
+  }
+};
+const trim = list => {
+  const items = list.querySelectorAll(':scope > :not([data-infinite-spacer]):not([data-infinite-next]):not(script)');
+  const sc = scroller(list), top = sc ? sc.getBoundingClientRect().top : 0, view = sc ? sc.clientHeight : innerHeight;
+  let n = 0;
+  while (items.length - n > +list.dataset.infiniteList && items[n].getBoundingClientRect().bottom < top - view) n++;
+  if (!n) return;
+  const keep = items[n], spacer = list.querySelector(':scope > [data-infinite-spacer]'), before = keep.getBoundingClientRect().top;
+  for (let i = 0; i < n; i++) items[i].remove();
+  spacer.style.height = (parseFloat(spacer.style.height) || 0) + before - keep.getBoundingClientRect().top + 'px';
+};
+document.addEventListener('htmx:beforeRequest', e => {
+  const el = e.detail.elt, list = el.dataset && el.dataset.infiniteNext !== undefined && el.closest('[data-infinite-list]');
+  if (!list) return;
+  const seen = list._muiSeen || (list._muiSeen = new Set()), url = e.detail.requestConfig.path;
+  if (seen.has(url)) return e.preventDefault();
+  seen.add(url);
+  el.addEventListener('htmx:afterRequest', r => r.detail.successful || seen.delete(url), {once: true});
+});
+const pending = new Set();
+document.addEventListener('htmx:load', e => {
+  const list = e.target.parentElement && e.target.parentElement.closest('[data-infinite-list]');
+  if (!list || pending.has(list)) return;
+  pending.add(list);
+  requestAnimationFrame(() => { pending.delete(list); trim(list); });
+});
+})();
+'''
+
+def _list_item_tag(items):
+    "`Li` for the helper elements of a list of `Li`s, `Div` otherwise"
+    return fh.Li if items and getattr(items[-1], 'tag', None) == 'li' else Div
+
+def InfinitePage(*items, # Items of this page
+                 next_url:str=None, # URL of the following page (`None` on the last page)
+                 loader=None, # Shown while the next page loads (a `Skeleton` line by default)
+                 trigger:str='revealed', # htmx trigger loading the next page (use `intersect once` inside scrolling containers)
+                )->tuple: # (*items, element loading `next_url`)
+    "Items of one page of an `InfiniteList`, followed by the element that fetches the next page (return it from page routes)"
+    if not next_url: return items
+    return (*items, _list_item_tag(items)(Skeleton(lines=1) if loader is None else loader, hx_get=next_url, hx_trigger=trigger,
+                                          hx_swap='outerHTML', hx_sync='this:drop', data_infinite_next=True))
+
+def InfiniteList(*items, # Items of the first page (`Li`s, cards, ...)
+                 next_url:str=None, # URL of the second page (`None` if there isn't one)
+                 tag=fh.Ul, # Container of the items (e.g. `NavContainer` or `partial(Div, cls='space-y-4')` for a card feed)
+                 max_items:int=500, # Items kept in the DOM before the oldest ones (far above the viewport) are removed
+                 loader=None, # Shown while the next page loads (a `Skeleton` line by default)
+                 trigger:str='revealed', # htmx trigger loading the next page (use `intersect once` inside scrolling containers)
+                 cls=(), # Additional classes on the container
+                 **kwargs # Additional args for the container
+                )->FT: # tag(spacer, *items, next page loader)
+    "List that appends further pages from cursor paginated routes while scrolling, keeping at most `max_items` items in the DOM (needs `ComponentScripts()`)"
+    _needs_script('infinite_list', 'InfiniteList')
+    if cls: kwargs['cls'] = stringify(cls)
+    return tag(_list_item_tag(items)(data_infinite_spacer=True, aria_hidden='true'),
+               *InfinitePage(*items, next_url=next_url, loader=loader, trigger=trigger),
+               data_infinite_list=max_items, **kwargs)
+
 # %% ../nbs/02_franken.ipynb
 def ModalContainer(*c, # Components to put in the modal (often `ModalDialog`)
                      cls=(), # Additional classes on the `ModalContainer`
@@ -975,6 +1472,26 @@ def ModalCloseButton(*c, # Components to put in the button (often text and/or an
     kwargs['data-uk-close'] = True
     return Button(*c, cls=(stringify(cls)), **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+lazy_modal_js = '''
+(() => {
+if (window.__muiModals) return;
+const cache = window.__muiModals = new Map();
+document.addEventListener('beforeshow', e => {
+  const m = e.target;
+  if (!m.dataset || m.dataset.modalSrc === undefined || m.dataset.modalLoaded !== undefined) return;
+  const src = m.dataset.modalSrc, body = m.querySelector('.uk-modal-body');
+  m.dataset.modalLoaded = '';
+  const fill = html => htmx.swap ? htmx.swap(body, html, {swapStyle: 'innerHTML'}) : (body.innerHTML = html, htmx.process(body));
+  if (cache.has(src)) return fill(cache.get(src));
+  fetch(src, {headers: {'HX-Request': 'true'}})
+    .then(r => r.ok ? r.text() : Promise.reject(r.status))
+    .then(html => { cache.set(src, html); fill(html); })
+    .catch(() => delete m.dataset.modalLoaded);
+});
+})();
+'''
+
 # %% ../nbs/02_franken.ipynb
 def Modal(*c,                 # Components to put in the `ModalBody` (often forms, sign in buttons, images, etc.)
         header=None,          # Components that go in the `ModalHeader` (often a `ModalTitle`)
@@ -987,6 +1504,7 @@ def Modal(*c,                 # Components to put in the `ModalBody` (often form
         id='',                # id for the outermost container
         hx_init=False,        # Initialize modal with UIKit on load (used for modals added to the DOM by HTMX)
         hx_open=False,        # Open modal on load (used for modals added to the DOM by HTMX)
+        body_url:str=None,    # Fetch the body from this URL on first open (`c` is shown while it loads, needs `ComponentScripts()`)
         **kwargs              # Additional args for the outermost `Div` tag
         )->FT: # Fully styled modal FT Component
     "Creates a modal with the appropriate classes to put the boilerplate in the appropriate places for you"
@@ -994,6 +1512,10 @@ def Modal(*c,                 # Components to put in the `ModalBody` (often form
     if hx_open: kwargs["hx_on__load"] = f"UIkit.modal('#{id}').show()"
     if hx_init and not hx_open: kwargs["hx_on__load"] = f"UIkit.modal('#{id}')"
     if hx_open or hx_init: kwargs["hx-on:hidden"] = "this.remove()"
+    if body_url:
+        _needs_script('modal', 'Modal(body_url=...)')
+        kwargs['data_modal_src'] = body_url
+        c = c or (Div(cls='h-24 animate-pulse rounded-md bg-muted'),)
     cls, dialog_cls, header_cls, body_cls, footer_cls = map(stringify, (cls, dialog_cls, header_cls, body_cls, footer_cls))
     res = []
     if header: res.append(ModalHeader(cls=header_cls)(header))
@@ -1009,6 +1531,66 @@ def Placeholder(*c, # Components to put in the placeholder
     "Creates a placeholder"
     return fh.Div(*c, cls=('uk-placeholder',stringify(cls)), **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+def Skeleton(lines:int=3, # Number of text lines to draw
+             cls=(), # Additional classes on the placeholder
+             **kwargs # Additional args for `Div` tag
+            )->FT: # Placeholder(Div(...), ...)
+    "A pulsing `Placeholder` of text lines, shown while content loads"
+    widths = ('w-full', 'w-5/6', 'w-2/3', 'w-3/4')
+    return Placeholder(*[Div(cls=f'h-4 rounded bg-muted animate-pulse {widths[i % len(widths)]}') for i in range(lines)],
+                       cls=('space-y-3', stringify(cls)), aria_busy='true', **kwargs)
+
+# %% ../nbs/02_franken.ipynb
+deferred_js = '''
+(() => {
+if (!window.__muiDeferred) {
+  const s = window.__muiDeferred = {max: +document.currentScript.dataset.max || 4, active: 0, queue: []};
+  const pump = () => {
+    s.queue.sort((a, b) => (+b.dataset.priority || 0) - (+a.dataset.priority || 0));
+    while (s.active < s.max && s.queue.length) {
+      const el = s.queue.shift();
+      if (!el.isConnected) continue;
+      s.active++;
+      htmx.trigger(el, 'muideferred');
+    }
+  };
+  const ready = el => { s.queue.push(el); pump(); };
+  document.addEventListener('htmx:afterRequest', e => {
+    if (e.detail.elt.dataset && e.detail.elt.dataset.deferred !== undefined) { s.active--; pump(); }
+  });
+  const observer = margin => new IntersectionObserver((es, io) => es.forEach(e => {
+    if (e.isIntersecting) { io.unobserve(e.target); ready(e.target); }
+  }), {rootMargin: margin});
+  const seen = {revealed: observer('0px'), intersect: observer('200px')};
+  s.scan = () => document.querySelectorAll('[data-deferred]:not([data-deferred-seen])').forEach(el => {
+    el.dataset.deferredSeen = '';
+    if (el.dataset.deferred in seen) seen[el.dataset.deferred].observe(el);
+    else if (document.readyState === 'complete') ready(el);
+    else addEventListener('load', () => ready(el));
+  });
+  document.addEventListener('htmx:load', s.scan);
+}
+document.readyState === 'loading' ? document.addEventListener('DOMContentLoaded', window.__muiDeferred.scan) : window.__muiDeferred.scan();
+})();
+'''
+
+# %% ../nbs/02_franken.ipynb
+def Deferred(url:str, # URL that returns the real content (it replaces the whole `Deferred`)
+             *c, # Shown until the content loads (a `Skeleton` if empty)
+             trigger:str='intersect', # `intersect` (just before it scrolls into view or a hidden tab/dropdown opens), `revealed` or `load`
+             priority:int=0, # Queued loads with a higher priority start first
+             max_concurrent:int=None, # Deprecated and ignored: the limit is page wide, set with `ComponentScripts(max_deferred=...)`
+             cls=(), # Additional classes on the container
+             **kwargs # Additional args for `Div` tag
+            )->FT: # Div(Skeleton(), hx_get=url)
+    "Section whose content is loaded after the page, so slow widgets don't hold up the initial response (needs `ComponentScripts()`)"
+    if max_concurrent is not None:
+        warnings.warn('`Deferred(max_concurrent=...)` is ignored, use `ComponentScripts(max_deferred=...)`', DeprecationWarning, stacklevel=2)
+    _needs_script('deferred', 'Deferred')
+    return Div(*(c or (Skeleton(),)), hx_get=url, hx_trigger='muideferred',
+               hx_swap='outerHTML', data_deferred=trigger, data_priority=priority, cls=stringify(cls), **kwargs)
+
 # %% ../nbs/02_franken.ipynb
 def Progress(*c, # Components to put in the progress bar (often nothing)
              cls=(), # Additional classes on the progress bar
@@ -1019,6 +1601,53 @@ def Progress(*c, # Components to put in the progress bar (often nothing)
     "Creates a progress bar"
     return fh.Progress(*c, value=value, max=max, cls=('uk-progress',stringify(cls)), **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+_server_icons, _icons_used = False, contextvars.ContextVar('monsterui_icons_used')
+
+def server_icons(enable:bool=True, app=None):
+    "Render `UkIcon`s as inline SVG referencing an `IconSprite`, so pages no longer need the franken icon script"
+    if app is not None: _app_settings(app)['server_icons'] = enable
+    else:
+        global _server_icons
+        _server_icons = enable
+
+@lru_cache(maxsize=None)
+def _lucide_names():
+    try: import lucide
+    except ImportError: raise ImportError('Server side icons need the `lucide` package: `pip install "monsterui[icons]"`') from None
+    with zipfile.ZipFile(importlib.resources.files('lucide') / 'lucide.zip') as z: return {n[:-4]: None for n in z.namelist()}
+
+@lru_cache(maxsize=None)
+def _icon_symbol(name:str)->str:
+    "`<symbol>` for the lucide icon `name` (empty for unknown icons)"
+    if name not in _lucide_names(): return ''
+    with zipfile.ZipFile(importlib.resources.files('lucide') / 'lucide.zip') as z: svg = z.read(f'{name}.svg').decode()
+    inner = re.sub(r'>\s+<', '><', re.sub(r'\s+', ' ', svg[svg.index('>') + 1:svg.rindex('</svg>')]).strip())
+    return f'<symbol id="mui-i-{name}" viewBox="0 0 24 24">{inner}</symbol>'
+
+def _use_icon(name:str):
+    "Records that the page uses icon `name`"
+    used = _icons_used.get(None)
+    if used is None: _icons_used.set(used := {})
+    used[name] = None
+
+class IconSprite:
+    "Hidden SVG sprite with a `<symbol>` for each icon rendered by `UkIcon` in the current request"
+    def __init__(self, oob:bool=False): # Append to the page's sprite with an htmx out of band swap (for partials)
+        self.oob = oob
+    def __ft__(self):
+        used = _icons_used.get(None) or {}
+        symbols = ''.join(_icon_symbol(n) for n in used)
+        used.clear()
+        if self.oob: return NotStr(f'<svg hx-swap-oob="beforeend:#mui-icon-sprite">{symbols}</svg>' if symbols else '')
+        return NotStr(f'<svg id="mui-icon-sprite" xmlns="http://www.w3.org/2000/svg" style="display:none">{symbols}</svg>')
+
+    @staticmethod
+    def beforeware(skip:list=None): # Paths (regexes) that skip the beforeware
+        "Beforeware giving each request its own set of used icons, shared with sync handlers running in the threadpool"
+        async def _before(req): _icons_used.set(req.scope.setdefault('monsterui.icons', {}))
+        return fh.Beforeware(_before, skip=skip)
+
 # %% ../nbs/02_franken.ipynb
 def UkIcon(icon:str, # Icon name from [lucide icons](https://lucide.dev/icons/)
            height:int=None, 
@@ -1028,7 +1657,11 @@ def UkIcon(icon:str, # Icon name from [lucide icons](https://lucide.dev/icons/)
            **kwargs # Additional args for `Uk_icon` tag
            )->FT: # a lucide icon of the specified size 
     "Creates an icon using lucide icons"
-    return Uk_icon(icon=icon, height=height, width=width, stroke_width=stroke_width, cls=cls, **kwargs)
+    if not _setting('server_icons', _server_icons): return Uk_icon(icon=icon, height=height, width=width, stroke_width=stroke_width, cls=cls, **kwargs)
+    _use_icon(icon)
+    return fh.Svg(fh_comp.Use(href=f'#mui-i-{icon}'), width=width or 16, height=height or 16, fill='none', stroke='currentColor',
+                  stroke_width=stroke_width or 2, stroke_linecap='round', stroke_linejoin='round', aria_hidden='true',
+                  cls=stringify(cls) or None, **kwargs)
 
 # %% ../nbs/02_franken.ipynb
 def UkIconLink(icon:str,  # Icon name from [lucide icons](https://lucide.dev/icons/)
@@ -1051,8 +1684,9 @@ def DiceBearAvatar(seed_name:str, # Seed name (ie 'Isaac Flath')
                   ):          # Span with Avatar
     "Creates an Avatar using https://dicebear.com/"
     url = 'https://api.dicebear.com/8.x/lorelei/svg?seed='
+    src = _avatar_url(seed_name) if _img_path() else f"{url}{seed_name}"
     return Span(cls=f"relative flex h-{h} w-{w} shrink-0 overflow-hidden rounded-full bg-secondary")(
-            fh.Img(cls=f"aspect-square h-{h} w-{w}", alt="Avatar", loading="lazy", src=f"{url}{seed_name}"))
+            fh.Img(cls=f"aspect-square h-{h} w-{w}", alt="Avatar", loading="lazy", src=src))
 
 # %% ../nbs/02_franken.ipynb
 def Center(*c, # Components to center
@@ -1101,6 +1735,17 @@ class FlexT(VEnum):
     wrap_reverse = 'flex-wrap-reverse'
 
 # %% ../nbs/02_franken.ipynb
+def _grid_cls(n, cols_min=1, cols_max=4, cols_sm=None, cols_md=None, cols_lg=None, cols_xl=None, cols=None):
+    "Responsive `grid-cols-*` classes for a grid of `n` items"
+    if cols: cols_min = cols_sm = cols_md = cols_lg = cols_xl = cols
+    else:
+        cols_max = min(n, cols_max)
+        cols_sm = cols_sm or min(n, cols_min, cols_max)
+        cols_md = cols_md or min(n, cols_min+1, cols_max) 
+        cols_lg = cols_lg or min(n, cols_min+2, cols_max) 
+        cols_xl = cols_xl or cols_max
+    return f'grid grid-cols-{cols_min} sm:grid-cols-{cols_sm} md:grid-cols-{cols_md} lg:grid-cols-{cols_lg} xl:grid-cols-{cols_xl}'
+
 def Grid(*div, # `Div` components to put in the grid
          cols_min:int=1, # Minimum number of columns at any screen size
          cols_max:int=4, # Maximum number of columns allowed at any screen size
@@ -1113,15 +1758,74 @@ def Grid(*div, # `Div` components to put in the grid
          **kwargs # Additional args for `Div` tag
          )->FT: # Responsive grid component
     "Creates a responsive grid layout with smart defaults based on content"
-    if cols: cols_min = cols_sm = cols_md = cols_lg = cols_xl = cols
-    else:
-        n = len(div)
-        cols_max = min(n, cols_max)
-        cols_sm = cols_sm or min(n, cols_min, cols_max)
-        cols_md = cols_md or min(n, cols_min+1, cols_max) 
-        cols_lg = cols_lg or min(n, cols_min+2, cols_max) 
-        cols_xl = cols_xl or cols_max
-    return Div(cls=(f'grid grid-cols-{cols_min} sm:grid-cols-{cols_sm} md:grid-cols-{cols_md} lg:grid-cols-{cols_lg} xl:grid-cols-{cols_xl}', stringify(cls)), **kwargs)(*div)
+    return Div(cls=(_grid_cls(len(div), cols_min, cols_max, cols_sm, cols_md, cols_lg, cols_xl, cols), stringify(cls)), **kwargs)(*div)
+
+# %% ../nbs/02_franken.ipynb
+virtual_grid_js = '''
+(() => {
+if (!window.__muiVGrid) {
+  const s = window.__muiVGrid = {grids: new Set()};
+  const update = el => {
+    const d = el.dataset, win = el.querySelector(':scope > [data-vgrid-window]'), [top, bottom] = el.querySelectorAll(':scope > [data-vgrid-spacer]');
+    const cs = getComputedStyle(win), c = cs.gridTemplateColumns.split(' ').filter(Boolean).length || 1, gap = parseFloat(cs.rowGap) || 0;
+    const rendered = Math.ceil(win.children.length / c);
+    if (rendered) el._rowH = (win.getBoundingClientRect().height + gap) / rendered;
+    const h = el._rowH || +d.rowHeight, total = +d.total, rows = Math.ceil(total / c), r = el.getBoundingClientRect();
+    const vis = [Math.max(0, Math.floor(-r.top / h)), Math.min(rows, Math.ceil((innerHeight - r.top) / h))];
+    const size = (a, b) => { top.style.height = a / c * h + 'px'; bottom.style.height = Math.max(0, rows - Math.ceil(b / c)) * h + 'px'; };
+    if (+d.start % c === 0 && +d.start <= vis[0] * c && Math.min(total, vis[1] * c) <= +d.end) return size(+d.start, +d.end);
+    const start = Math.max(0, vis[0] - +d.overscan) * c, end = Math.min(total, (vis[1] + +d.overscan) * c), key = start + ':' + end;
+    if (el._pending === key) return;
+    el._pending = key;
+    fetch(d.virtualGrid + (d.virtualGrid.includes('?') ? '&' : '?') + `start=${start}&end=${end}`, {headers: {'HX-Request': 'true'}})
+      .then(r => r.ok ? r.text() : Promise.reject(r.status))
+      .then(html => {
+        if (el._pending !== key) return;
+        htmx.swap ? htmx.swap(win, html, {swapStyle: 'innerHTML'}) : (win.innerHTML = html, htmx.process(win));
+        Object.assign(d, {start, end});
+        size(start, end);
+      })
+      .finally(() => { if (el._pending === key) el._pending = null; });
+  };
+  let frame;
+  const onScroll = () => frame || (frame = requestAnimationFrame(() => {
+    frame = null;
+    s.grids.forEach(el => el.isConnected ? update(el) : s.grids.delete(el));
+  }));
+  addEventListener('scroll', onScroll, {passive: true});
+  addEventListener('resize', onScroll);
+  s.scan = () => { document.querySelectorAll('[data-virtual-grid]').forEach(el => s.grids.add(el)); onScroll(); };
+  document.addEventListener('htmx:load', s.scan);
+}
+document.readyState === 'loading' ? document.addEventListener('DOMContentLoaded', window.__muiVGrid.scan) : window.__muiVGrid.scan();
+})();
+'''
+
+# %% ../nbs/02_franken.ipynb
+def VirtualGrid(*div, # `Div`s of the initial window (items `start` to `start+len(div)`)
+                url:str, # Route returning the `Div`s of items `start` to `end` (query params)
+                total:int, # Total number of items in the grid
+                start:int=0, # Index of the first item in `div`
+                row_height:int=300, # Estimated row height in px until rendered rows can be measured
+                overscan:int=2, # Rows rendered above and below the viewport
+                cols_min:int=1, # Minimum number of columns at any screen size
+                cols_max:int=4, # Maximum number of columns allowed at any screen size
+                cols_sm:int=None, # Number of columns on small screens
+                cols_md:int=None, # Number of columns on medium screens
+                cols_lg:int=None, # Number of columns on large screens
+                cols_xl:int=None, # Number of columns on extra large screens
+                cols:int=None, # Number of columns on all screens
+                cls='gap-4', # Additional classes on the grid (tip: `gap` provides spacing for grids)
+                **kwargs # Additional args for the outer `Div`
+               )->FT: # Div(Div(spacer), Grid window, Div(spacer))
+    "Responsive grid that only renders the rows in view, fetching other windows from `url` while scrolling (needs `ComponentScripts()`)"
+    _needs_script('virtual_grid', 'VirtualGrid')
+    grid_cls = _grid_cls(total, cols_min, cols_max, cols_sm, cols_md, cols_lg, cols_xl, cols)
+    return Div(Div(data_vgrid_spacer=True),
+               Div(*div, cls=(grid_cls, stringify(cls)), data_vgrid_window=True),
+               Div(data_vgrid_spacer=True),
+               data_virtual_grid=url, data_total=total, data_start=start, data_end=start+len(div),
+               data_row_height=row_height, data_overscan=overscan, style='overflow-anchor:none', **kwargs)
 
 # %% ../nbs/02_franken.ipynb
 def DivFullySpaced(*c,                # Components
@@ -1204,10 +1908,17 @@ def NavContainer(*li, # List items are navigation elements (Special `Li` such as
 
 # %% ../nbs/02_franken.ipynb
 def NavParentLi(*nav_container, # `NavContainer` container for a nested nav with `parent=False`)
+                children_url:str=None, # Fetch the nested `NavContainer` from this URL on first expand instead
                 cls=(), # Additional classes on the li
                 **kwargs # Additional args for the li
                )->FT: # Navigation list item
     "Creates a navigation list item with a parent nav for nesting"
+    if children_url:
+        # Placeholder sub nav so `uk_nav` can still toggle the section; sections rendered open (`uk-open`) load right away
+        is_open = 'uk-open' in stringify(cls).split()
+        nav_container = (*nav_container, fh.Ul(fh.Li(Div(cls='h-4 w-2/3 rounded bg-muted animate-pulse'), aria_busy='true'),
+            cls='uk-nav-sub', hx_get=children_url, hx_trigger=('load, ' if is_open else '') + 'show from:closest li',
+            hx_swap='outerHTML', hx_on__before_request=_lazy_once, data_lazy_nav=True))
     return fh.Li(*nav_container,  cls=('uk-parent',  stringify(cls)),**kwargs)
 def NavDividerLi(*c, # Components
                  cls=(), # Additional classes on the li
@@ -1249,6 +1960,7 @@ def NavBar(*c, # Component for right side of navbar (Often A tag links)
            cls='p-4', # Classes for navbar
            scrollspy_cls=ScrollspyT.underline, # Scrollspy class (usually ScrollspyT.*)
            menu_id=None, # ID for menu container (used for mobile toggle)
+           render_once:bool=False, # Render `c` once, switching between the desktop and mobile layouts with CSS
            )->FT: # Responsive NavBar
     "Creates a responsive navigation bar with mobile menu support"
     if menu_id is None: menu_id = fh.unqid()
@@ -1256,6 +1968,17 @@ def NavBar(*c, # Component for right side of navbar (Often A tag links)
     if uk_scrollspy_nav == True: uk_scrollspy_nav = 'closest: a; scroll: true'
 
     mobile_icon = A(UkIcon("menu", width=30, height=30), cls="md:hidden", data_uk_toggle=f"target: #{menu_id}; cls: hidden")
+    if render_once:
+        # Mobile: a centered column wrapping below the brand, toggled by `mobile_icon`. Desktop: inline on the right
+        responsive = lambda pre, c: ' '.join(f'{pre}:{o}' for o in stringify(c).split())
+        return Div(
+            DivFullySpaced(
+                brand, mobile_icon,
+                Div(*c, id=menu_id, uk_scrollspy_nav=uk_scrollspy_nav,
+                    cls=('hidden flex w-full flex-col items-center md:flex md:w-auto md:flex-row',
+                         responsive('max-md', mobile_cls), responsive('md', right_cls))),
+                cls=('monster-navbar w-full flex-wrap', stringify(cls), stringify(scrollspy_cls))),
+            cls=sticky_cls)
     return Div(
         Div(
             DivFullySpaced(
@@ -1304,16 +2027,81 @@ def SliderNav(
              uk_slidenav_next=True, uk_slider_item='next', **kwargs)
     )
 
+# %% ../nbs/02_franken.ipynb
+slider_more_js = '''
+(() => {
+if (!window.__muiSlider) {
+  const s = window.__muiSlider = {};
+  const more = el => {
+    const d = el.dataset, list = el.querySelector('.uk-slider-items'), n = list.children.length;
+    if (el._muiLoading || d.sliderDone !== undefined) return;
+    if (d.total && n >= +d.total) return d.sliderDone = '';
+    el._muiLoading = true;
+    fetch(d.sliderMore + (d.sliderMore.includes('?') ? '&' : '?') + 'start=' + n, {headers: {'HX-Request': 'true'}})
+      .then(r => r.ok ? r.text() : Promise.reject(r.status))
+      .then(html => {
+        if (!html.trim()) return d.sliderDone = '';
+        htmx.swap ? htmx.swap(list, html, {swapStyle: 'beforeend'}) : (list.insertAdjacentHTML('beforeend', html), htmx.process(list));
+        UIkit.update(el);
+        check(el);
+      })
+      .finally(() => el._muiLoading = false);
+  };
+  // Fetch the next slides once the last visible slide is within `ahead` slides of the last one loaded
+  const check = el => {
+    const list = el.querySelector('.uk-slider-items'), shown = list.querySelectorAll(':scope > .uk-active');
+    const last = shown[shown.length - 1] || list.firstElementChild;
+    if (!last || list.children.length - 1 - [...list.children].indexOf(last) <= +el.dataset.sliderAhead) more(el);
+  };
+  const slider = e => e.target.closest && e.target.closest('[data-slider-more]');
+  document.addEventListener('itemshown', e => { const el = slider(e); if (el) check(el); });
+  document.addEventListener('click', e => {
+    const el = e.target.closest && e.target.closest('[uk-slider-item], [data-uk-slider-item]') && slider(e);
+    if (el) setTimeout(() => check(el));
+  });
+  s.scan = () => document.querySelectorAll('[data-slider-more]:not([data-slider-seen])').forEach(el => {
+    el.dataset.sliderSeen = '';
+    setTimeout(() => check(el));
+  });
+  document.addEventListener('htmx:load', s.scan);
+}
+document.readyState === 'loading' ? document.addEventListener('DOMContentLoaded', window.__muiSlider.scan) : window.__muiSlider.scan();
+})();
+'''
+
+def _lazy_imgs(ft):
+    "Marks the `Img`s in `ft` to load lazily over a muted placeholder background"
+    if not isinstance(ft, FT): return
+    if ft.tag == 'img':
+        ft.attrs.setdefault('loading', 'lazy')
+        ft.attrs.setdefault('decoding', 'async')
+        ft.attrs['class'] = f"{ft.attrs.get('class', '')} bg-muted".strip()
+    for o in ft.children: _lazy_imgs(o)
+
+def SliderSlides(*c, # Slides to add to a `Slider` (often `Div`s with an `Img`)
+                )->tuple: # The slides with lazily loaded images
+    "Slides with lazily loaded images over a placeholder, returned by `Slider` `more_url` routes"
+    c = copy.deepcopy(c)  # leave the caller's components (which may be reused or cached) untouched
+    for o in c: _lazy_imgs(o)
+    return c
+
 # %% ../nbs/02_franken.ipynb
 def Slider(*c, # Items to show in slider
            cls='', # Classes for slider container
            items_cls='gap-4', # Classes for items container
            nav=True, # Whether to show navigation arrows
            nav_cls='', # Classes for navigation arrows
+           more_url:str=None, # Route returning further slides (`SliderSlides`) from the `start` query param on (needs `ComponentScripts()`)
+           total:int=None, # Total number of slides available from `more_url` (fetches stop at an empty page otherwise)
+           ahead:int=3, # Fetch more slides when the last visible one is this close to the last loaded one
            **kwargs # Additional args for slider container
     ) -> FT: # SliderContainer(SliderItems(..., cls='gap-4'), SliderNav?)
     "Creates a slider with optional navigation arrows"
     nav_comp = SliderNav(cls=nav_cls) if nav else ()
+    if more_url:
+        _needs_script('slider', 'Slider(more_url=...)')
+        c = SliderSlides(*c)
+        kwargs.update(data_slider_more=more_url, data_total=total, data_slider_ahead=ahead)
     return SliderContainer(
         SliderItems(*c, cls=items_cls),
         *nav_comp,
@@ -1488,6 +2276,88 @@ def TableFromDicts(header_data:Sequence, # List of header data
         **kwargs
     )
 
+# %% ../nbs/02_franken.ipynb
+def TableStream(header_data:Sequence, # List of header data
+                body_data:Iterable[dict], # Iterable (often a generator) of dicts of body data
+                footer_data=None, # Dict of footer data
+                header_cell_render=Th, # Function(content) -> FT that renders header cells
+                body_cell_render=lambda k,v : Td(v), # Function(key, content) -> FT that renders body cells
+                footer_cell_render=lambda k,v : Td(v), #  Function(key, content) -> FT that renders footer cells
+                cls=(TableT.middle, TableT.divider, TableT.hover, TableT.sm), # Additional classes on the table
+                sortable=False, # Whether to use sortable table
+                chunk_size=500, # Number of rows serialized per yielded chunk
+                **kwargs # Additional args for the table
+               )->Iterator[str]: # Html chunks of the table
+    "Lazily renders a `TableFromDicts` style table, yielding html strings a chunk of rows at a time"
+    marker = '<!--monsterui-tbody-->'
+    shell = to_xml(Table(
+        Thead(Tr(*[header_cell_render(h) for h in header_data])),
+        Tbody(NotStr(marker), sortable=sortable),
+        Tfoot(Tr(*[footer_cell_render(k, footer_data.get(k.lower(), '')) for k in header_data])) if footer_data else '',
+        cls=stringify(cls),
+        **kwargs), indent=False)
+    head, tail = shell.split(marker)
+    yield head
+    for rows in chunked(body_data, chunk_size):
+        yield ''.join(to_xml(Tr(*[body_cell_render(k, r.get(k, '')) for k in header_data]), indent=False) for r in rows)
+    yield tail
+
+# %% ../nbs/02_franken.ipynb
+@delegates(TableStream)
+def TableStreamResponse(header_data:Sequence, # List of header data
+                        body_data:Iterable[dict], # Iterable (often a generator) of dicts of body data
+                        **kwargs # Additional args for `TableStream`
+                       ): # StreamingResponse that sends the table in chunks
+    "A `StreamingResponse` that sends a `TableStream` to the client as it is rendered"
+    return fh.StreamingResponse(TableStream(header_data, body_data, **kwargs), media_type='text/html')
+
+# %% ../nbs/02_franken.ipynb
+def _col_values(col):
+    "Converts a list, NumPy array, pandas Series or pyarrow Array into a list of python values"
+    if hasattr(col, 'to_pylist'): return col.to_pylist()
+    if hasattr(col, 'tolist'): return col.tolist()
+    return list(col)
+
+def _data_columns(data):
+    "Dict of header -> column for a dict of columns, pandas DataFrame or pyarrow Table"
+    if hasattr(data, 'column_names'): return {n: data.column(n) for n in data.column_names}
+    if hasattr(data, 'columns') and not isinstance(data, dict): return {str(c): data[c] for c in data.columns}
+    return dict(data)
+
+def _cell_str(v):
+    "Escapes a cell value the same way `to_xml` does"
+    if v is None: return ''
+    if hasattr(v, '__html__'): return v.__html__()
+    return escape(v, quote=False) if isinstance(v, str) else str(v)
+
+# %% ../nbs/02_franken.ipynb
+def TableFromColumns(data, # Dict of header -> column, pandas DataFrame or pyarrow Table
+                     formatters:dict=None, # Dict of header -> Function(value) -> str applied to every value in that column
+                     col_cls:dict=None, # Dict of header -> classes for every `Td` in that column
+                     footer_data=None, # List of footer data
+                     header_cell_render=Th, # Function(content) -> FT that renders header cells
+                     footer_cell_render=Td, #  Function(content) -> FT that renders footer cells
+                     cls=(TableT.middle, TableT.divider, TableT.hover, TableT.sm), # Additional classes on the table
+                     sortable=False, # Whether to use sortable table
+                     **kwargs # Additional args for the table
+                    )->FT: # Table from columns
+    "Creates a Table from columns of data, formatting and escaping each column in bulk"
+    cols, formatters, col_cls = _data_columns(data), ifnone(formatters, {}), ifnone(col_cls, {})
+    body = []
+    for h, col in cols.items():
+        td = to_xml(Td(cls=col_cls.get(h, ())), indent=False)[:-5]
+        fmt = formatters.get(h)
+        if fmt is None and getattr(getattr(col, 'dtype', None), 'kind', None) in ('b','i','u','f'): vals = map(str, _col_values(col))
+        else: vals = map(_cell_str, map(fmt, _col_values(col)) if fmt else _col_values(col))
+        body.append([f'{td}{v}</td>' for v in vals])
+    if len({len(b) for b in body}) > 1: raise ValueError(f'Columns have different lengths: { {h: len(b) for h, b in zip(cols, body)} }')
+    return Table(
+        Thead(Tr(*map(header_cell_render, cols))),
+        Tbody(NotStr(''.join(f"<tr>{''.join(r)}</tr>" for r in zip(*body))), sortable=sortable),
+        Tfoot(Tr(*map(footer_cell_render, footer_data))) if footer_data else '',
+        cls=stringify(cls),
+        **kwargs)
+
 # %% ../nbs/02_franken.ipynb
 franken_class_map = {
     'h1': 'uk-h1 text-4xl font-bold mt-12 mb-6',
@@ -1543,12 +2413,96 @@ def apply_classes(html_str:str, # Html string
         return ''.join(etree.tostring(c, encoding='unicode', method='html') for c in html_str)
     except (etree.ParserError,ValueError): return html_str
 
+# %% ../nbs/02_franken.ipynb
+_raster_exts = {'.png', '.jpg', '.jpeg', '.webp', '.avif', '.gif', '.bmp', '.tif', '.tiff'}
+
+class ImagePipeline:
+    "Resized AVIF/WebP variants, intrinsic sizes and LQIP placeholders for local images, cached on disk by source hash"
+    def __init__(self, 
+                 cache_dir:str='static/_img', # Directory the derived files are written to
+                 url_prefix:str=None, # URL `cache_dir` is served from (defaults to `/{cache_dir}`)
+                 root:str='.', # Directory local image URLs are resolved against
+                 widths:Sequence[int]=(320, 640, 960, 1280, 1920), # Variant widths (never wider than the source)
+                 formats:Sequence[str]=('avif', 'webp'), # Variant formats, in order of preference
+                 quality:int=70, # Encoder quality
+                 lqip_width:int=16, # Width of the inlined low quality placeholder
+                ):
+        self.cache_dir,self.root = pathlib.Path(cache_dir),pathlib.Path(root).resolve()
+        self.url_prefix = (url_prefix or '/' + self.cache_dir.as_posix()).rstrip('/')
+        self.widths,self.formats,self.quality,self.lqip_width,self._info = sorted(widths),formats,quality,lqip_width,{}
+
+    def path(self, src:str):
+        "Local raster file for the image URL `src` (`None` for remote images, other file types, missing files and paths outside `root`)"
+        if src.startswith(('http://', 'https://', 'data:', 'blob:', 'attachment:')): return None
+        p = (self.root / unquote(src.split('?')[0].split('#')[0]).lstrip('/')).resolve()
+        if p.suffix.lower() not in _raster_exts or not p.is_relative_to(self.root): return None
+        return p if p.is_file() else None
+
+    def info(self, src:str)->dict:
+        "Intrinsic size, LQIP and variant URLs of `src`, generating the variants the first time it is seen (`None` if it can't be decoded)"
+        if (p := self.path(src)) is None: return None
+        st = p.stat()
+        memo = (str(p), st.st_mtime_ns, st.st_size)
+        if memo in self._info: return self._info[memo]
+        data = p.read_bytes()
+        key = hashlib.sha1(data).hexdigest()[:16]
+        meta = self.cache_dir / f'{key}.json'
+        if meta.exists(): info = json.loads(meta.read_text())
+        elif (info := self._generate(data, key)) is not None: meta.write_text(json.dumps(info))
+        if info is None:
+            self._info[memo] = None
+            return None
+        info['sources'] = {fmt: [(f'{self.url_prefix}/{n}', w) for w, n in vs] for fmt, vs in info['variants'].items()}
+        self._info[memo] = info
+        return info
+
+    def _generate(self, data, key):
+        try: from PIL import Image, ImageOps, features
+        except ImportError: raise ImportError('`ImagePipeline` needs the `pillow` package: `pip install "monsterui[images]"`') from None
+        try:
+            im = Image.open(io.BytesIO(data))
+            im.load()
+            im = ImageOps.exif_transpose(im)
+        except (OSError, ValueError, SyntaxError, Image.DecompressionBombError): return None
+        if im.mode not in ('RGB', 'RGBA'): im = im.convert('RGBA' if im.mode in ('LA', 'P', 'PA') else 'RGB')
+        w, h = im.size
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        variants = {}
+        for fmt in self.formats:
+            if not features.check(fmt): continue
+            variants[fmt] = []
+            for vw in [x for x in self.widths if x < w] + [w]:
+                name = f'{key}-{vw}.{fmt}'
+                if not (self.cache_dir / name).exists():
+                    im.resize((vw, max(1, round(h * vw / w))), Image.LANCZOS).save(self.cache_dir / name, fmt.upper(), quality=self.quality)
+                variants[fmt].append((vw, name))
+        buf = io.BytesIO()
+        im.resize((self.lqip_width, max(1, round(h * self.lqip_width / w)))).save(buf, 'WEBP', quality=30)
+        return dict(width=w, height=h, lqip='data:image/webp;base64,' + base64.b64encode(buf.getvalue()).decode(), variants=variants)
+
+# %% ../nbs/02_franken.ipynb
+def ResponsiveImg(src:str, # URL of the image (local images are resolved against the pipeline's `root`)
+                  pipeline:ImagePipeline, # Pipeline that generates the variants
+                  alt:str='', # Alt text
+                  sizes:str='100vw', # `sizes` for the `srcset`s
+                  cls=(), # Additional classes on the `Img`
+                  **kwargs # Additional args for the `Img` tag
+                 )->FT: # Picture(Source(...), Img(...))
+    "Lazily loaded `Picture` with AVIF/WebP `srcset`s, intrinsic width/height and a blurred LQIP background"
+    info = pipeline.info(src)
+    if info is None: return fh.Img(src=src, alt=alt, loading='lazy', decoding='async', cls=stringify(cls), **kwargs)
+    style = f"background:url({info['lqip']}) center/cover no-repeat;" + kwargs.pop('style', '')
+    return fh.Picture(
+        *[fh.Source(type=f'image/{fmt}', srcset=', '.join(f'{u} {w}w' for u, w in vs), sizes=sizes) for fmt, vs in info['sources'].items() if vs],
+        fh.Img(src=src, alt=alt, width=info['width'], height=info['height'], loading='lazy', decoding='async',
+               cls=stringify(cls), style=style, **kwargs))
+
 # %% ../nbs/02_franken.ipynb
 class FrankenRenderer(HTMLRenderer):
     "Custom renderer for Franken UI that handles image paths"
-    def __init__(self, *args, img_dir=None, **kwargs):
+    def __init__(self, *args, img_dir=None, images=None, **kwargs):
         super().__init__(*args, **kwargs)
-        self.img_dir = img_dir
+        self.img_dir,self.images = img_dir,images
 
     
     
@@ -1559,6 +2513,9 @@ class FrankenRenderer(HTMLRenderer):
         src = token.src
         if self.img_dir and not src.startswith(('http://', 'https://', '/', 'attachment:', 'blob:', 'data:')):
             src = f'{pathlib.Path(self.img_dir)}/{src}'
+        if self.images and self.images.info(src):
+            return to_xml(ResponsiveImg(src, self.images, alt=token.children[0].content if token.children else '', title=token.title or None,
+                                        cls='max-w-full h-auto rounded-lg mb-6'), indent=False)
         return template.format(src, token.children[0].content if token.children else '', title)
 
 # %% ../nbs/02_franken.ipynb
@@ -1566,11 +2523,12 @@ def render_md(md_content:str, # Markdown content
              class_map=None, # Class map
              class_map_mods=None, # Additional class map
              img_dir:str=None, # Directory containing images
+             images:ImagePipeline=None, # Pipeline for responsive local images
              renderer=FrankenRenderer # custom renderer
              )->FT: # Rendered markdown
     "Renders markdown using mistletoe and lxml with custom image handling"
     if md_content=='': return md_content
-    html_content = mistletoe.markdown(md_content, partial(renderer, img_dir=img_dir))
+    html_content = mistletoe.markdown(md_content, partial(renderer, img_dir=img_dir, **({'images': images} if images else {})))
     return NotStr(apply_classes(html_content, class_map, class_map_mods))
 
 # %% ../nbs/02_franken.ipynb
@@ -1614,21 +2572,571 @@ def LightboxItem(*c, # Component that when clicked will open the lightbox (often
                  data_alt=None, # Alt text for the lightbox item/image
                  data_caption=None, # Caption for the item that shows below it
                  cls='', # Class for the A tag (often nothing or `uk-btn`)
+                 images:ImagePipeline=None, # Serve a local `href` as its largest generated variant
                  **kwargs # Additional args for the `A` tag
                 )->FT: # A(... href, data_alt, cls., ...)
     "Anchor tag with appropriate structure to go inside a `LightBoxContainer`"
+    if images and (info := images.info(href)) and (vs := next((v for v in info['sources'].values() if v), None)):
+        href, kwargs = vs[-1][0], {'data_type': 'image', **kwargs}
     return fh.A(*c, href=href, data_alt=data_alt, cls=stringify(cls), **kwargs)
 
+# %% ../nbs/02_franken.ipynb
+def _lttb_idx(x, y, n):
+    "Indices of the `n` points kept by Largest-Triangle-Three-Buckets downsampling"
+    import numpy as np
+    l = len(y)
+    if n >= l or n < 3: return np.arange(l)
+    edges = np.linspace(1, l-1, n-1).astype(int)
+    idx, a = np.empty(n, dtype=int), 0
+    idx[0], idx[-1] = 0, l-1
+    for i in range(n-2):
+        s, e = edges[i], edges[i+1]
+        ns, ne = e, edges[i+2] if i+2 < n-1 else l
+        cx, cy = x[ns:ne].mean(), y[ns:ne].mean()
+        area = np.abs((x[a]-cx)*(y[s:e]-y[a]) - (x[a]-x[s:e])*(cy-y[a]))
+        a = s + int(area.argmax())
+        idx[i+1] = a
+    return idx
+
+def _minmax_idx(y, n):
+    "Indices of the min and max point of each of `n//2` buckets (plus the first and last point)"
+    import numpy as np
+    l = len(y)
+    if n >= l: return np.arange(l)
+    bs = -(-l // max(n//2, 1))
+    nb = -(-l // bs)
+    b = np.concatenate([y.astype(float), np.full(nb*bs-l, np.nan)]).reshape(nb, bs)
+    offs = np.arange(nb) * bs
+    keep = ~np.isnan(b).all(axis=1)
+    b, offs = b[keep], offs[keep]
+    return np.unique(np.concatenate([[0, l-1], offs + np.nanargmin(b, axis=1), offs + np.nanargmax(b, axis=1)]).astype(int))
+
+def _downsample_idx(x, y, n, downsample='lttb'):
+    "Indices kept when downsampling to `n` points: NaN points stay out of the buckets, but the first of each run of them is kept so gaps still show"
+    import numpy as np
+    def _idx(x, y, n): return _lttb_idx(x, y, n) if downsample == 'lttb' else _minmax_idx(y, n)
+    ok = ~np.isnan(y)
+    if ok.all(): return _idx(x, y, n)
+    pos = np.flatnonzero(ok)
+    gaps = np.flatnonzero(~ok & np.concatenate([[True], ok[:-1]]))
+    return np.union1d(pos[_idx(x[pos], y[pos], max(n - len(gaps), n//2))], gaps)
+
+# %% ../nbs/02_franken.ipynb
+def _series_xy(data):
+    "Splits series `data` (list, NumPy array, pandas Series or [x, y] pairs) into NumPy `x` (or None) and `y` arrays"
+    import numpy as np
+    if hasattr(data, 'index') and hasattr(data, 'to_numpy'):
+        return (None if type(data.index).__name__ == 'RangeIndex' else data.index.to_numpy()), data.to_numpy()
+    a = np.asarray(data)
+    if a.ndim == 2 and a.shape[1] == 2: return a[:, 0], a[:, 1]
+    return None, a
+
+def _apex_series(data, max_points=None, downsample='lttb', precision=None):
+    "Converts series `data` into apex `data`, downsampling to `max_points` with `lttb` or `minmax`"
+    import numpy as np
+    if isinstance(data, (list, tuple)) and data and isinstance(data[0], dict): return _apex_points(data, max_points, downsample)
+    x, y = _series_xy(data)
+    if x is not None and np.issubdtype(x.dtype, np.datetime64): x = x.astype('datetime64[ms]').astype('int64')
+    if y.dtype == object: y = y.astype(float)
+    if max_points and len(y) > max_points:
+        if x is None: x = np.arange(len(y))
+        xn = x if np.issubdtype(x.dtype, np.number) else np.arange(len(y))
+        idx = _downsample_idx(xn.astype(float), y.astype(float), max_points, downsample)
+        x, y = x[idx], y[idx]
+    if precision is not None and np.issubdtype(y.dtype, np.floating): y = y.round(precision)
+    y = [None if v != v else v for v in y.tolist()] if np.issubdtype(y.dtype, np.floating) else y.tolist()
+    if x is None: return y
+    return [[a, b] for a, b in zip(x.tolist(), y)]
+
+def _apex_points(data, max_points=None, downsample='lttb'):
+    "Downsamples apex `{x, y, ...}` point objects on `y`, keeping the points as they are (non numeric `y`s aren't downsampled)"
+    import numpy as np
+    if not max_points or len(data) <= max_points: return list(data)
+    try: y = np.array([p.get('y') for p in data], dtype=float)
+    except (TypeError, ValueError): return list(data)
+    if y.ndim != 1: return list(data)
+    x = np.asarray([p.get('x') for p in data])
+    xn = x.astype(float) if np.issubdtype(x.dtype, np.number) else np.arange(len(y), dtype=float)
+    idx = _downsample_idx(xn, y, max_points, downsample)
+    return [data[i] for i in idx]
+
+def _apex_opts(opts, **kwargs):
+    "Copy of `opts` with array/dataframe series converted (and downsampled) into apex `data`"
+    series = opts.get('series')
+    if series is None: return opts
+    if hasattr(series, 'columns'): series = [{'name': str(c), 'data': series[c]} for c in series.columns]
+    def _needs(d): return not isinstance(d, (list, tuple)) or bool(kwargs.get('max_points')) and len(d) > kwargs['max_points']
+    series = [{**s, 'data': _apex_series(s['data'], **kwargs)} if isinstance(s, dict) and _needs(s.get('data', [])) else s for s in series]
+    return {**opts, 'series': series}
+
+def _json_default(o):
+    if hasattr(o, 'tolist'): return o.tolist()
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+def _nan_to_none(o):
+    "Copy of `o` with NaN floats in nested dicts and lists replaced by `None`"
+    if isinstance(o, float): return None if o != o else o
+    if isinstance(o, dict): return {k: _nan_to_none(v) for k, v in o.items()}
+    if isinstance(o, (list, tuple)): return [_nan_to_none(v) for v in o]
+    if hasattr(o, 'tolist'): return _nan_to_none(o.tolist())
+    return o
+
+def _apex_json(opts):
+    "Compact JSON for chart options, using `orjson` when it is installed (NaN becomes `null` either way)"
+    try: import orjson
+    except ImportError:
+        try: return json.dumps(opts, separators=(',', ':'), default=_json_default, allow_nan=False)
+        except ValueError: return json.dumps(_nan_to_none(opts), separators=(',', ':'), default=_json_default)
+    return orjson.dumps(opts, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY|orjson.OPT_NON_STR_KEYS).decode()
+
+# %% ../nbs/02_franken.ipynb
+apex_stream_js = '''
+(() => {
+if (!window.__muiApexStream) {
+  const instance = id => ((window.Apex && window.Apex._chartInstances) || []).find(c => c.id === id);
+  const apply = (chart, m) => {
+    const animate = m.animate ?? false;
+    if (m.op === 'update') return chart.updateSeries(m.series, animate);
+    if (m.op === 'options') return chart.updateOptions(m.options, false, animate);
+    if (!m.keep) return chart.appendData(m.series.map(data => ({data})));
+    chart.updateSeries(chart.w.config.series.map((s, i) => ({...s, data: s.data.concat(m.series[i] || []).slice(-m.keep)})), animate);
+  };
+  const connect = el => {
+    const id = el.dataset.chartId, pending = [];
+    let src;
+    const flush = () => {
+      if (!el.isConnected) return src.close();
+      const c = instance(id);
+      if (!c) return setTimeout(flush, 100);
+      while (pending.length) apply(c.chart, pending.shift());
+    };
+    const recv = data => { pending.push(JSON.parse(data)); if (pending.length === 1) flush(); };
+    if (el.dataset.chartProto === 'ws') {
+      const u = new URL(el.dataset.chartStream, location.href);
+      if (u.protocol.startsWith('http')) u.protocol = u.protocol === 'https:' ? 'wss:' : 'ws:';
+      src = new WebSocket(u);
+      src.onmessage = e => recv(e.data);
+    } else {
+      src = new EventSource(el.dataset.chartStream);
+      src.addEventListener('chart', e => recv(e.data));
+    }
+  };
+  window.__muiApexStream = () => document.querySelectorAll('[data-chart-stream]:not([data-chart-live])').forEach(el => {
+    el.dataset.chartLive = '';
+    connect(el);
+  });
+  document.addEventListener('htmx:load', window.__muiApexStream);
+}
+document.readyState === 'loading' ? document.addEventListener('DOMContentLoaded', window.__muiApexStream) : window.__muiApexStream();
+})();
+'''
+
 # %% ../nbs/02_franken.ipynb
 def ApexChart(*, 
-              opts:Dict, # ApexChart options used to render your chart (e.g. {"chart":{"type":"line"}, ...})
+              opts:Dict=None, # ApexChart options used to render your chart (e.g. {"chart":{"type":"line"}, ...})
               cls: Enum | str | tuple = (), # Classes for the outer container
+              max_points:int=None, # Downsample each series to at most this many points
+              downsample:str='lttb', # Downsampling method (`lttb` or `minmax`)
+              precision:int=None, # Round float values to this many decimals
+              stream_url:str=None, # `ChartStream` endpoint whose updates are applied to the rendered chart (needs `ComponentScripts()`)
+              stream_proto:str='sse', # Protocol of `stream_url` (`sse` or `ws`)
+              lazy:bool|str=False, # Load the options from this URL (a route returning `ApexChartData`), or with `True` from `chart_data_routes` (needs `ComponentScripts()`)
               **kws, # Additional args for the outer container
               )->FT:  # Div(Uk_chart(Script(...)))
     "Apex chart component"
-    js=NotStr(f"<script type='application/json'>{json.dumps(opts)}</script>")
+    if stream_url:
+        _needs_script('charts', 'ApexChart(stream_url=...)')
+        chart_id = (opts or {}).get('chart', {}).get('id') or fh.unqid()
+        if opts is not None: opts = {**opts, 'chart': {**opts.get('chart', {}), 'id': chart_id}}
+        kws.update(data_chart_stream=stream_url, data_chart_proto=stream_proto, data_chart_id=chart_id)
+    if lazy: _needs_script('charts', 'ApexChart(lazy=...)')
+    if isinstance(lazy, str): return Div(cls=stringify(cls), data_chart_src=lazy, **kws)
+    opts = _apex_opts(opts, max_points=max_points, downsample=downsample, precision=precision)
+    if lazy: return Div(cls=stringify(cls), data_chart_src=chart_data_url(_apex_json(opts)), **kws)
+    js=NotStr(f"<script type='application/json'>{_apex_json(opts)}</script>")
     return Div(Uk_chart(js), cls=stringify(cls), **kws)
 
+# %% ../nbs/02_franken.ipynb
+class ChartStream:
+    "Fans out updates of a data stream to every subscribed `ApexChart`"
+    def __init__(self, maxsize:int=100): # Updates queued per subscriber before the oldest are dropped
+        self.subscribers,self.maxsize = set(),maxsize
+
+    def publish(self, msg:dict):
+        "Serializes `msg` once and queues it for every subscriber"
+        data = _apex_json(msg)
+        for q in self.subscribers:
+            if q.full(): q.get_nowait()
+            q.put_nowait(data)
+        return data
+
+    def append(self, *series, keep:int=None, animate:bool=False):
+        "Appends new points to each series, optionally keeping only the last `keep` points"
+        return self.publish(dict(op='append', series=[_apex_series(s) for s in series], keep=keep, animate=animate))
+
+    def update(self, series, animate:bool=False):
+        "Replaces every series (a list of series dicts or a `DataFrame`)"
+        return self.publish(dict(op='update', series=_apex_opts({'series': series})['series'], animate=animate))
+
+    def options(self, opts:dict, animate:bool=False):
+        "Updates chart options"
+        return self.publish(dict(op='options', options=opts, animate=animate))
+
+    async def subscribe(self):
+        "Yields serialized updates until the subscriber disconnects"
+        q = asyncio.Queue(self.maxsize)
+        self.subscribers.add(q)
+        try:
+            while True: yield await q.get()
+        finally: self.subscribers.discard(q)
+
+    async def _sse(self):
+        async for data in self.subscribe(): yield f'event: chart\ndata: {data}\n\n'
+
+    def sse(self):
+        "`text/event-stream` response for an `ApexChart` with `stream_proto='sse'`"
+        return fh.EventStream(self._sse())
+
+    async def ws(self, ws):
+        "Forwards updates to the websocket `ws` for an `ApexChart` with `stream_proto='ws'`"
+        async for data in self.subscribe(): await ws.send_text(data)
+
+# %% ../nbs/02_franken.ipynb
+apex_lazy_js = '''
+(() => {
+if (!window.__muiApexLazy) {
+  window.__muiApexLazy = () => document.querySelectorAll('[data-chart-src]:not([data-chart-loaded])').forEach(el => {
+    el.dataset.chartLoaded = '';
+    fetch(el.dataset.chartSrc).then(r => r.ok ? r.json() : Promise.reject(r.status)).then(opts => {
+      if (el.dataset.chartId) opts.chart = {...opts.chart, id: el.dataset.chartId};
+      const chart = document.createElement('uk-chart'), data = document.createElement('script');
+      data.type = 'application/json';
+      data.textContent = JSON.stringify(opts);
+      chart.append(data);
+      el.querySelector(':scope > .mui-chart-error')?.remove();
+      el.prepend(chart);
+    }).catch(err => {
+      delete el.dataset.chartLoaded;
+      el.dataset.chartError = err;
+      if (el.querySelector(':scope > .mui-chart-error')) return;
+      const msg = document.createElement('button');
+      msg.type = 'button';
+      msg.className = 'mui-chart-error uk-text-muted text-sm';
+      msg.textContent = 'Chart unavailable. Retry';
+      msg.onclick = () => { msg.remove(); window.__muiApexLazy(); };
+      el.prepend(msg);
+      el.dispatchEvent(new CustomEvent('mui:chart-error', {bubbles: true, detail: err}));
+    });
+  });
+  document.addEventListener('htmx:load', window.__muiApexLazy);
+}
+document.readyState === 'loading' ? document.addEventListener('DOMContentLoaded', window.__muiApexLazy) : window.__muiApexLazy();
+})();
+'''
+
+# %% ../nbs/02_franken.ipynb
+_chart_data, _chart_data_max, _chart_data_path, _chart_data_dir = {}, 512, '/_monsterui/chart', None
+
+def chart_data_url(data:str)->str:
+    "Stores serialized chart options and returns their content-hashed URL"
+    key = hashlib.sha1(data.encode()).hexdigest()[:16]
+    _chart_data[key] = _chart_data.pop(key, data)
+    if len(_chart_data) > _chart_data_max: del _chart_data[next(iter(_chart_data))]
+    cache = _setting('chart_dir', _chart_data_dir)
+    if cache and not (p := cache / f'{key}.json').exists(): p.write_text(data)
+    return f"{_setting('chart_path', _chart_data_path)}/{key}.json"
+
+def chart_data_routes(app, # FastHTML app to add the endpoint to
+                      path:str='/_monsterui/chart', # URL prefix of the endpoint
+                      cache_dir:str=None, # Also keep serialized charts in this directory (survives restarts, shared by workers)
+                      max_entries:int=512, # Number of serialized charts kept in memory (one store, shared by the apps of the process)
+                     ):
+    "Adds the endpoint serving the options of `lazy=True` `ApexChart`s to `app`"
+    global _chart_data_path, _chart_data_max, _chart_data_dir
+    path, cache = path.rstrip('/'), pathlib.Path(cache_dir) if cache_dir else None
+    if cache: cache.mkdir(parents=True, exist_ok=True)
+    # charts rendered during `app`'s requests use its settings; elsewhere those of the last configured app
+    _app_settings(app).update(chart_path=path, chart_dir=cache)
+    _chart_data_path, _chart_data_max, _chart_data_dir = path, max_entries, cache
+    @app.route(f'{path}/{{key}}.json', methods=['get'])
+    def _chart_data_endpoint(req, key:str):
+        data = _chart_data.get(key)
+        if data is None and cache and (p := cache / f'{pathlib.Path(key).name}.json').exists(): data = p.read_text()
+        if data is None: return fh.Response(status_code=404)
+        hdrs = {'ETag': f'"{key}"', 'Cache-Control': 'public, max-age=31536000, immutable'}
+        if req.headers.get('if-none-match') == hdrs['ETag']: return fh.Response(status_code=304, headers=hdrs)
+        return fh.Response(data, media_type='application/json', headers=hdrs)
+    return _chart_data_endpoint
+
+def ApexChartData(opts:Dict, # ApexChart options, as passed to `ApexChart`
+                  req=None, # Request, to answer a matching `If-None-Match` with 304
+                  max_points:int=None, # Downsample each series to at most this many points
+                  downsample:str='lttb', # Downsampling method (`lttb` or `minmax`)
+                  precision:int=None, # Round float values to this many decimals
+                 ):
+    "JSON response with the options of an `ApexChart(lazy=url)`, regenerated by the route at `url` on every request"
+    data = _apex_json(_apex_opts(opts, max_points=max_points, downsample=downsample, precision=precision))
+    hdrs = {'ETag': f'"{hashlib.sha1(data.encode()).hexdigest()[:16]}"', 'Cache-Control': 'no-cache'}
+    if req is not None and req.headers.get('if-none-match') == hdrs['ETag']: return fh.Response(status_code=304, headers=hdrs)
+    return fh.Response(data, media_type='application/json', headers=hdrs)
+
+# %% ../nbs/02_franken.ipynb
+def _chart_columns(data, *names):
+    "Columns `names` of records, a dict of columns, a `DataFrame` or a pyarrow `Table`"
+    import numpy as np
+    if isinstance(data, (list, tuple)):
+        # NaN among strings must stay NaN (a missing key) rather than become the string 'nan'
+        def _col(c):
+            a = np.asarray(c)
+            return np.asarray(c, dtype=object) if a.dtype.kind in 'US' and any(v != v for v in c) else a
+        return [_col([r[n] for r in data]) for n in names]
+    cols = _data_columns(data)
+    return [cols[n] if hasattr(cols[n], 'dtype') or hasattr(cols[n], 'to_pylist') else np.asarray(cols[n]) for n in names]
+
+def _chart_labels(a):
+    "JSON friendly list of the unique keys `a`"
+    return (a.astype(str) if a.dtype.kind in 'mM' else a).tolist()
+
+def _codes_agg(codes, n, values=None, agg='sum'):
+    "`agg` (`sum`, `mean`, `count`, `min` or `max`) of `values` for each of the `n` integer group `codes`"
+    import numpy as np
+    counts = np.bincount(codes, minlength=n)
+    if agg == 'count' or values is None: return counts
+    values = np.asarray(values, dtype=float)
+    if agg in ('sum', 'mean'):
+        s = np.bincount(codes, weights=values, minlength=n)
+        if agg == 'sum': return s
+        with np.errstate(invalid='ignore', divide='ignore'): return s / counts
+    if agg not in ('min', 'max'): raise ValueError(f'Unknown aggregation {agg!r}')
+    order = np.argsort(codes, kind='stable')
+    res = np.full(n, np.nan)
+    present = counts > 0
+    res[present] = getattr(np, 'minimum' if agg == 'min' else 'maximum').reduceat(values[order], np.cumsum(counts)[present] - counts[present])
+    return res
+
+def _encode(a):
+    "Sorted unique values of the column `a` and the integer code of each element (-1 for missing values)"
+    import numpy as np
+    a = a.to_numpy() if hasattr(a, 'to_pylist') else a
+    try: import pandas as pd
+    except ImportError:
+        a = np.asarray(a)
+        if a.dtype.kind == 'f': missing = np.isnan(a)
+        elif a.dtype.kind in 'mM': missing = np.isnat(a)
+        elif a.dtype.kind == 'O': missing = np.fromiter((v is None or v != v for v in a.tolist()), dtype=bool, count=len(a))
+        else: missing = np.zeros(len(a), dtype=bool)
+        codes = np.full(len(a), -1)
+        uniq, codes[~missing] = np.unique(a[~missing], return_inverse=True)
+        return uniq, codes
+    codes, uniq = pd.factorize(a, sort=True)
+    return np.asarray(uniq), codes
+
+def _grouped(row_codes, nrows, col_codes, ncols, values=None, agg='sum'):
+    "`nrows` by `ncols` matrix of `values` aggregated by row and column code, dropping elements with a missing key"
+    import numpy as np
+    keep = (row_codes >= 0) & (col_codes >= 0)
+    if values is not None: values = np.asarray(values, dtype=float)[keep]
+    return _codes_agg(row_codes[keep]*ncols + col_codes[keep], nrows*ncols, values, agg).reshape(nrows, ncols)
+
+def _series_data(a, precision):
+    "Rounded list of the values `a`, with `None` for missing values"
+    import numpy as np
+    a = np.asarray(a, dtype=float)
+    if precision is not None: a = a.round(precision)
+    return [None if v != v else v for v in a.tolist()]
+
+# %% ../nbs/02_franken.ipynb
+def bar_chart_opts(data, # Records, dict of columns, `DataFrame` or pyarrow `Table`
+                   x:str, # Column whose values become the categories
+                   y:str=None, # Column to aggregate (rows are counted if `None`)
+                   agg:str='sum', # Aggregation: `sum`, `mean`, `count`, `min` or `max`
+                   series:str=None, # Column splitting the bars into one series per value
+                   sort:bool=False, # Sort categories by descending total instead of by key
+                   top:int=None, # Only keep this many categories (after sorting)
+                   precision:int=2, # Round values to this many decimals
+                   chart_type:str='bar', # Apex chart type (e.g. `bar`, `line`, `area`)
+                   **opts, # Extra options merged into the result
+                  )->dict: # `opts` for `ApexChart`
+    "Groups `data` by `x` (and `series`) and builds chart options from the aggregated `y`"
+    import numpy as np
+    cols = _chart_columns(data, *[c for c in (x, y, series) if c])
+    xs, ys, ss = cols[0], cols[1] if y else None, cols[-1] if series else None
+    cats, xc = _encode(xs)
+    if series is None: names, sc = np.array([y or 'count']), np.zeros(len(xc), dtype=int)
+    else: names, sc = _encode(ss)
+    m = _grouped(sc, len(names), xc, len(cats), ys, agg)
+    idx = np.arange(len(cats))
+    if sort: idx = np.argsort(-np.nansum(m, axis=0), kind='stable')
+    if top: idx = idx[:top]
+    return {'chart': {'type': chart_type},
+            'series': [{'name': str(n), 'data': _series_data(row[idx], precision)} for n, row in zip(names.tolist(), m)],
+            'xaxis': {'categories': _chart_labels(cats[idx])}, **opts}
+
+def histogram_opts(data, # Values, or records/columns/`DataFrame` when `x` is given
+                   x:str=None, # Column to bin
+                   bins:int|list=20, # Number of bins or list of bin edges
+                   range:tuple=None, # (min, max) of the bins, defaults to the data range
+                   name:str='count', # Series name
+                   fmt:str='{:g}', # Format of the bin edges in the category labels
+                   **opts, # Extra options merged into the result
+                  )->dict: # `opts` for `ApexChart`
+    "Bins `data` with `np.histogram` and builds bar chart options with one bar per bin"
+    import numpy as np
+    vals = np.asarray(_chart_columns(data, x)[0] if x else data)
+    counts, edges = np.histogram(vals[~np.isnan(vals)] if vals.dtype.kind == 'f' else vals, bins=bins, range=range)
+    labels = [f'{fmt.format(lo)}–{fmt.format(hi)}' for lo, hi in zip(edges[:-1].tolist(), edges[1:].tolist())]
+    return {'chart': {'type': 'bar'}, 'plotOptions': {'bar': {'columnWidth': '95%'}},
+            'series': [{'name': name, 'data': counts.tolist()}], 'xaxis': {'categories': labels}, **opts}
+
+def heatmap_opts(data, # Records, dict of columns, `DataFrame` or pyarrow `Table`
+                 x:str, # Column whose values become the heatmap columns
+                 y:str, # Column whose values become the heatmap rows
+                 value:str=None, # Column to aggregate (rows are counted if `None`)
+                 agg:str='sum', # Aggregation: `sum`, `mean`, `count`, `min` or `max`
+                 precision:int=2, # Round values to this many decimals
+                 **opts, # Extra options merged into the result
+                )->dict: # `opts` for `ApexChart`
+    "Pivots `data` into a `y` by `x` matrix of aggregated `value`s and builds heatmap options"
+    cols = _chart_columns(data, *[c for c in (x, y, value) if c])
+    (xcats, xc), (ycats, yc) = _encode(cols[0]), _encode(cols[1])
+    m = _grouped(yc, len(ycats), xc, len(xcats), cols[2] if value else None, agg)
+    xl = _chart_labels(xcats)
+    return {'chart': {'type': 'heatmap'}, 'dataLabels': {'enabled': False},
+            'series': [{'name': str(n), 'data': [{'x': c, 'y': v} for c, v in zip(xl, _series_data(row, precision))]}
+                       for n, row in zip(_chart_labels(ycats), m)], **opts}
+
+# %% ../nbs/02_franken.ipynb
+def _chart_color(color): return f'hsl(var(--chart-{color}))' if isinstance(color, int) else color
+
+def _num(v): return f'{v:.2f}'.rstrip('0').rstrip('.')
+
+def _mini_vals(data): return tuple(None if v is None or v != v else float(v) for v in _col_values(data))
+
+def _mini_svg(body, width, height, cls, label, attrs):
+    "Wraps `body` in an `svg` tag of `width` x `height`"
+    extra = ''.join(f' {k.lstrip("_").replace("_", "-")}="{escape(str(v))}"' for k, v in attrs)
+    aria = f' role="img" aria-label="{escape(label)}"' if label else ' aria-hidden="true"'
+    if cls: aria = f' class="{escape(cls)}"' + aria
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" viewBox="0 0 {width} {height}" '
+            f'preserveAspectRatio="none"{aria}{extra}>{body}</svg>')
+
+def _scale(vals, lo, hi, size, pad=0.):
+    "Maps `vals` from [`lo`, `hi`] onto [`size`-`pad`, `pad`] (SVG y grows downwards)"
+    rng = (hi - lo) or 1.
+    return [pad + (size - 2*pad) * (1 - (v - lo) / rng) for v in vals]
+
+@lru_cache(maxsize=2048)
+def _sparkline_svg(vals, color, width, height, fill, dot, stroke_width, cls, label, attrs):
+    ok = [v for v in vals if v is not None]
+    if not ok: return _mini_svg('', width, height, cls, label, attrs)
+    c, pad = _chart_color(color), stroke_width
+    step = (width - 2*pad) / max(len(vals) - 1, 1)
+    ys = _scale([ok[0] if v is None else v for v in vals], min(ok), max(ok), height, pad)
+    segs = [[]] # Missing values split the line into segments
+    for i, v in enumerate(vals):
+        if v is not None: segs[-1].append(i)
+        elif segs[-1]: segs.append([])
+    segs = [s for s in segs if s]
+    x = lambda i: _num(pad + i*step)
+    pts = [' '.join(f'{x(i)},{_num(ys[i])}' for i in s) for s in segs]
+    body = ''
+    if fill: body += ''.join(f'<polygon points="{x(s[0])},{height} {p} {x(s[-1])},{height}" fill="{c}" fill-opacity="0.15"/>' for s, p in zip(segs, pts))
+    body += ''.join(f'<polyline points="{p}" fill="none" stroke="{c}" stroke-width="{stroke_width}" stroke-linejoin="round" '
+                    f'stroke-linecap="round" vector-effect="non-scaling-stroke"/>' for p in pts)
+    if dot: body += f'<circle cx="{x(segs[-1][-1])}" cy="{_num(ys[segs[-1][-1]])}" r="{stroke_width*1.5}" fill="{c}"/>'
+    return _mini_svg(body, width, height, cls, label, attrs)
+
+@lru_cache(maxsize=2048)
+def _minibar_svg(vals, color, width, height, gap, cls, label, attrs):
+    ok = [v for v in vals if v is not None]
+    if not ok: return _mini_svg('', width, height, cls, label, attrs)
+    c = _chart_color(color)
+    lo, hi = min(min(ok), 0.), max(max(ok), 0.)
+    zero = _scale([0.], lo, hi, height)[0]
+    bw = max((width - gap*(len(vals)-1)) / len(vals), 0.5)
+    bars = ''.join(f'<rect x="{_num(i*(bw+gap))}" y="{_num(min(y, zero))}" width="{_num(bw)}" height="{_num(abs(zero - y))}"/>'
+                   for i, (v, y) in enumerate(zip(vals, _scale([0. if v is None else v for v in vals], lo, hi, height))) if v is not None)
+    return _mini_svg(f'<g fill="{c}">{bars}</g>', width, height, cls, label, attrs)
+
+@lru_cache(maxsize=2048)
+def _bullet_svg(value, target, ranges, max_value, color, width, height, cls, label, attrs):
+    c = _chart_color(color)
+    mx = max_value or max((value, target or 0, *ranges)) or 1.
+    x = lambda v: _num(max(min(v / mx, 1.), 0.) * width)
+    body = ''.join(f'<rect width="{x(r)}" height="{height}" fill="{c}" fill-opacity="{_num(0.1 + 0.1*i)}"/>'
+                   for i, r in enumerate(sorted(ranges, reverse=True)))
+    body += f'<rect y="{_num(height/3)}" width="{x(value)}" height="{_num(height/3)}" fill="{c}"/>'
+    if target is not None:
+        body += f'<rect x="{_num(max(float(x(target)) - 1, 0))}" y="{_num(height/6)}" width="2" height="{_num(height*2/3)}" fill="currentColor"/>'
+    return _mini_svg(body, width, height, cls, label, attrs)
+
+@lru_cache(maxsize=512)
+def _heatmap_svg(rows, color, cell, gap, cls, label, attrs):
+    c = _chart_color(color)
+    vals = [v for r in rows for v in r if v is not None]
+    lo, hi = (min(vals), max(vals)) if vals else (0., 1.)
+    rng = (hi - lo) or 1.
+    cells = ''.join(f'<rect x="{i*(cell+gap)}" y="{j*(cell+gap)}" width="{cell}" height="{cell}" rx="1" '
+                    f'fill-opacity="{_num(0.1 + 0.9*(v - lo)/rng)}"><title>{_num(v)}</title></rect>'
+                    for j, r in enumerate(rows) for i, v in enumerate(r) if v is not None)
+    ncols = max((len(r) for r in rows), default=0)
+    return _mini_svg(f'<g fill="{c}">{cells}</g>', max(ncols*(cell+gap) - gap, 0), max(len(rows)*(cell+gap) - gap, 0), cls, label, attrs)
+
+# %% ../nbs/02_franken.ipynb
+def Sparkline(data, # Values (list, NumPy array, pandas Series, ...)
+              color:int|str=1, # Theme chart colour (1-5) or any CSS colour
+              width:int=100, # Width in px
+              height:int=24, # Height in px
+              fill:bool=True, # Shade the area under the line
+              dot:bool=True, # Mark the last value
+              stroke_width:float=1.5, # Line width in px
+              cls:Enum|str|tuple=(), # Classes for the `svg`
+              label:str=None, # Accessible label (the chart is hidden from screen readers without one)
+              **kwargs # Additional attributes for the `svg`
+              )->NotStr: # Inline `svg`
+    "Server rendered line sparkline (missing values break the line)"
+    return NotStr(_sparkline_svg(_mini_vals(data), color, width, height, fill, dot, stroke_width, stringify(cls), label, tuple(kwargs.items())))
+
+def MiniBar(data, # Values (list, NumPy array, pandas Series, ...)
+            color:int|str=1, # Theme chart colour (1-5) or any CSS colour
+            width:int=100, # Width in px
+            height:int=24, # Height in px
+            gap:float=1, # Gap between bars in px
+            cls:Enum|str|tuple=(), # Classes for the `svg`
+            label:str=None, # Accessible label (the chart is hidden from screen readers without one)
+            **kwargs # Additional attributes for the `svg`
+            )->NotStr: # Inline `svg`
+    "Server rendered mini bar chart (negative values hang below the zero line, missing values are left out)"
+    return NotStr(_minibar_svg(_mini_vals(data), color, width, height, gap, stringify(cls), label, tuple(kwargs.items())))
+
+def BulletChart(value:float, # Measured value
+                target:float=None, # Target, drawn as a marker
+                ranges:Sequence=(), # Qualitative range limits (e.g. poor, ok, good) drawn as shaded bands
+                max_value:float=None, # Value at the right edge, defaults to the largest of the above
+                color:int|str=1, # Theme chart colour (1-5) or any CSS colour
+                width:int=120, # Width in px
+                height:int=16, # Height in px
+                cls:Enum|str|tuple=(), # Classes for the `svg`
+                label:str=None, # Accessible label (the chart is hidden from screen readers without one)
+                **kwargs # Additional attributes for the `svg`
+                )->NotStr: # Inline `svg`
+    "Server rendered bullet chart"
+    return NotStr(_bullet_svg(float(value), None if target is None else float(target), tuple(r for r in _mini_vals(ranges) if r is not None), max_value, color,
+                              width, height, stringify(cls), label, tuple(kwargs.items())))
+
+def HeatmapGrid(data, # Rows of values (list of lists, 2D NumPy array, `DataFrame`), `None` leaves a gap
+                color:int|str=1, # Theme chart colour (1-5) or any CSS colour
+                cell:int=10, # Cell size in px
+                gap:int=2, # Gap between cells in px
+                cls:Enum|str|tuple=(), # Classes for the `svg`
+                label:str=None, # Accessible label (the chart is hidden from screen readers without one)
+                **kwargs # Additional attributes for the `svg`
+                )->NotStr: # Inline `svg`
+    "Server rendered heatmap grid whose cell opacity follows the value"
+    rows = data.to_numpy().tolist() if hasattr(data, 'to_numpy') else data.tolist() if hasattr(data, 'tolist') else data
+    rows = tuple(tuple(None if v is None or v != v else float(v) for v in r) for r in rows)
+    return NotStr(_heatmap_svg(rows, color, cell, gap, stringify(cls), label, tuple(kwargs.items())))
+
 # %% ../nbs/02_franken.ipynb
 spy_js = '''
 const slug = (s) => s.toLowerCase().trim().replace(/[^a-z0-9\s-]/g, '').replace(/\s+/g, '-').replace(/-+/g, '-');
@@ -1674,3 +3182,22 @@ def ToggleBtn(*c, cls='uk-btn-default', checked_cls='bg-primary', label_kw={}, *
     "Styled toggle button component, acts like a switch"
     return fh.Label(c, Input(type='checkbox', hidden=True, **kwargs), tabindex="0",
                     cls=stringify(('uk-btn text-nowrap cursor-pointer', cls, *[f'has-[:checked]:{c}' for c in checked_cls.split()])))
+
+# %% ../nbs/02_franken.ipynb
+def ComponentScripts(deferred:bool=True, # `Deferred` scheduler
+                     max_deferred:int=4, # Most deferred loads in flight at once on the page
+                     virtual_grid:bool=True, # `VirtualGrid` windowing
+                     infinite_list:bool=True, # `InfiniteList` trimming and duplicate page guard
+                     slider:bool=True, # `Slider(more_url=...)` loading
+                     modal:bool=True, # `Modal(body_url=...)` loading
+                     select:bool=True, # `Select(search_url=...)` search
+                     upload:bool=True, # `Upload(chunked=True)` and `UploadZone(chunked=True)` uploads
+                     charts:bool=True, # Lazy and streamed `ApexChart`s
+                    )->tuple: # Scripts to add to the app headers
+    "Scripts behind the data attributes rendered by MonsterUI components, added once to the headers"
+    _scripts_seen.update(k for k, v in dict(deferred=deferred, virtual_grid=virtual_grid, infinite_list=infinite_list, slider=slider,
+                                            modal=modal, select=select, upload=upload, charts=charts).items() if v)
+    scripts = [(deferred, deferred_js, dict(data_max=max_deferred)), (virtual_grid, virtual_grid_js, {}), (infinite_list, infinite_list_js, {}),
+               (slider, slider_more_js, {}), (modal, lazy_modal_js, {}), (select, remote_select_js, {}), (upload, upload_js, {}),
+               (charts, apex_lazy_js, {}), (charts, apex_stream_js, {})]
+    return tuple(fh.Script(js, **kw) for on, js, kw in scripts if on)